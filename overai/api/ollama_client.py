@@ -120,6 +120,46 @@ class OllamaClient:
             logger.error(f"Chat error: {e}")
             return f"Error: {str(e)}"
 
+    def chat_stream(self, model: str, messages: List[Dict]):
+        """
+        Send chat request to Ollama and stream the response.
+
+        Args:
+            model: Model name (e.g., "llama3.2")
+            messages: List of message dicts with 'role' and 'content'
+
+        Yields:
+            Response text chunks as Ollama produces them. Network
+            errors are raised to the caller.
+        """
+        data = {
+            "model": model,
+            "messages": messages,
+            "stream": True
+        }
+
+        req = urllib.request.Request(
+            f"{self.base_url}/api/chat",
+            data=json.dumps(data).encode('utf-8'),
+            method="POST"
+        )
+        req.add_header("Content-Type", "application/json")
+
+        logger.debug(f"Streaming chat to {model}")
+
+        with urllib.request.urlopen(req, timeout=120) as response:
+            # Ollama streams newline-delimited JSON objects
+            for line in response:
+                line = line.strip()
+                if not line:
+                    continue
+                chunk = json.loads(line)
+                content = chunk.get('message', {}).get('content', '')
+                if content:
+                    yield content
+                if chunk.get('done'):
+                    break
+
 
 # Singleton instance
 _ollama_client: Optional[OllamaClient] = None
@@ -3,6 +3,8 @@ App Delegate - Main application controller with optimized lifecycle management.
 Follows Apple design patterns with proper memory management.
 """
 
+import gc
+
 import objc
 from Foundation import NSObject, NSNotificationCenter, NSTimer
 from AppKit import NSApp
@@ -75,6 +77,11 @@ class AppDelegate(NSObject):
             # Show onboarding window
             logger.info("Showing onboarding for accessibility permission")
             self._onboarding = show_onboarding(self._on_onboarding_complete)
+
+        # Move everything alive at startup (module globals, PyObjC
+        # metadata) to the permanent generation so later collections -
+        # including pressure-triggered ones - stop rescanning it
+        gc.freeze()
     
     def _on_onboarding_complete(self, success: bool):
         """Called when onboarding completes."""
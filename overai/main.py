@@ -4,7 +4,6 @@ Optimized for memory efficiency and Apple Design compliance.
 """
 
 import sys
-import argparse
 
 # Import AppKit early for NSApplication
 from AppKit import NSApplication
@@ -20,8 +19,10 @@ APP_TITLE = "OverAI"
 PERMISSION_CHECK_EXIT = 1
 
 
-def create_argument_parser() -> argparse.ArgumentParser:
+def create_argument_parser():
     """Create argument parser."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description=f"{APP_TITLE} - AI Overlay for macOS"
     )
@@ -91,9 +92,22 @@ def run_app():
 
 def main():
     """Main entry point."""
+    # Fast path: no arguments means a GUI launch (double-click / login item).
+    # Skip argparse construction entirely to shave interpreter startup.
+    if len(sys.argv) == 1:
+        try:
+            run_app()
+        except KeyboardInterrupt:
+            print("\nInterrupted by user")
+            sys.exit(0)
+        except Exception as e:
+            logger.error(f"Fatal error: {e}")
+            raise
+        return
+
     parser = create_argument_parser()
     args = parser.parse_args()
-    
+
     # Handle version
     if args.version:
         from . import __version__
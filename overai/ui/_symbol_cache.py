@@ -0,0 +1,41 @@
+"""
+Shared cache for SF Symbol images.
+Resolving a symbol name goes through AppKit's symbol renderer each time,
+so frequently used icons (buttons, menu items, notifications) are cached
+per (name, size, tint) and reused across the UI.
+"""
+
+from functools import lru_cache
+
+from AppKit import NSImage
+
+
+@lru_cache(maxsize=64)
+def get_symbol(name, size=None, description=None, template=False, tint=None):
+    """
+    Get a shared NSImage for an SF Symbol name.
+
+    Args:
+        name: SF Symbol name (e.g. "sparkles")
+        size: Optional point size; None keeps the symbol's natural size
+        description: Accessibility description (defaults to the name)
+        template: Render as a template image (menu bar icons)
+        tint: Optional NSColor tint baked into the cached image
+
+    Returns:
+        The cached NSImage, or None if the symbol doesn't exist.
+    """
+    image = NSImage.imageWithSystemSymbolName_accessibilityDescription_(
+        name, description or name
+    )
+    if image is None:
+        return None
+
+    if size is not None:
+        image.setSize_((size, size))
+    if template:
+        image.setTemplate_(True)
+    if tint is not None:
+        image.setTintColor_(tint)
+
+    return image
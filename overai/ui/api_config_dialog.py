@@ -20,6 +20,62 @@ from ..utils.logger import Logger
 
 logger = Logger("APIConfigDialog")
 
+# Precomputed set of predefined service ids for O(1) membership checks
+# while filtering the custom-services list.
+_PREDEFINED = frozenset(PREDEFINED_APIS)
+
+# Shared fonts so each dialog open reuses the same NSFont instances.
+_LABEL_FONT = NSFont.systemFontOfSize_(12)
+_HEADER_FONT = NSFont.boldSystemFontOfSize_(14)
+_TITLE_FONT = NSFont.boldSystemFontOfSize_(16)
+
+
+def _configure_label(field, font):
+    """Apply the shared static-label configuration to a text field."""
+    field.setBezeled_(False)
+    field.setDrawsBackground_(False)
+    field.setEditable_(False)
+    field.setFont_(font)
+
+
+def _compute_layout(width, height):
+    """Precompute every fixed frame in the dialog as an NSRect table.
+
+    The dialog is a fixed-size modal, so the y-position arithmetic only
+    needs to run once at import time instead of on every open.
+    """
+    rects = {}
+    y_pos = height - 30
+
+    rects["title"] = NSMakeRect(20, y_pos - 20, 460, 24)
+    y_pos -= 50
+
+    for field in ("name", "format", "url", "key", "model"):
+        rects[field + "_label"] = NSMakeRect(20, y_pos - 2, 110, 20)
+        if field == "format":
+            rects["format_popup"] = NSMakeRect(140, y_pos - 4, 200, 26)
+        else:
+            rects[field + "_field"] = NSMakeRect(140, y_pos - 4, 340, 24)
+        y_pos -= 40
+
+    y_pos -= 10
+    rects["test_btn"] = NSMakeRect(20, y_pos, 100, 28)
+    rects["add_btn"] = NSMakeRect(280, y_pos, 90, 28)
+    rects["close_btn"] = NSMakeRect(380, y_pos, 90, 28)
+    y_pos -= 40
+
+    rects["separator"] = NSMakeRect(20, y_pos, 460, 1)
+    y_pos -= 30
+
+    rects["existing_label"] = NSMakeRect(20, y_pos, 460, 20)
+    y_pos -= 80
+
+    rects["services_list"] = (20, y_pos, 460, 70)
+    return rects
+
+
+_LAYOUT = _compute_layout(500, 450)
+
 
 class APIConfigDialog(NSObject):
     """
@@ -71,153 +127,100 @@ class APIConfigDialog(NSObject):
     def _setup_ui(self, window):
         """Setup the dialog UI."""
         content = window.contentView()
-        bounds = content.bounds()
-        
-        y_pos = bounds.size.height - 30
-        
+        subviews = []
+
         # Title
-        title = NSTextField.alloc().initWithFrame_(
-            NSMakeRect(20, y_pos - 20, 460, 24)
-        )
+        title = NSTextField.alloc().initWithFrame_(_LAYOUT["title"])
         title.setStringValue_("Add Custom AI API")
-        title.setBezeled_(False)
-        title.setDrawsBackground_(False)
-        title.setEditable_(False)
-        title.setFont_(NSFont.boldSystemFontOfSize_(16))
-        content.addSubview_(title)
-        
-        y_pos -= 50
-        
+        _configure_label(title, _TITLE_FONT)
+        subviews.append(title)
+
         # Service Name
-        name_label = self._create_label("Service Name:", 20, y_pos)
-        content.addSubview_(name_label)
-        
-        self._name_field = NSTextField.alloc().initWithFrame_(
-            NSMakeRect(140, y_pos - 4, 340, 24)
-        )
+        subviews.append(self._create_label("Service Name:", _LAYOUT["name_label"]))
+
+        self._name_field = NSTextField.alloc().initWithFrame_(_LAYOUT["name_field"])
         self._name_field.setBezelStyle_(NSTextFieldSquareBezel)
-        content.addSubview_(self._name_field)
-        
-        y_pos -= 40
-        
+        subviews.append(self._name_field)
+
         # API Format dropdown
-        format_label = self._create_label("API Format:", 20, y_pos)
-        content.addSubview_(format_label)
-        
-        self._format_popup = NSPopUpButton.alloc().initWithFrame_(
-            NSMakeRect(140, y_pos - 4, 200, 26)
-        )
+        subviews.append(self._create_label("API Format:", _LAYOUT["format_label"]))
+
+        self._format_popup = NSPopUpButton.alloc().initWithFrame_(_LAYOUT["format_popup"])
         self._format_popup.setBezelStyle_(NSBezelStyleRounded)
         self._format_popup.addItemWithTitle_("OpenAI Compatible")
         self._format_popup.addItemWithTitle_("Anthropic Claude")
         self._format_popup.addItemWithTitle_("Custom")
-        content.addSubview_(self._format_popup)
-        
-        y_pos -= 40
-        
+        subviews.append(self._format_popup)
+
         # Base URL
-        url_label = self._create_label("Base URL:", 20, y_pos)
-        content.addSubview_(url_label)
-        
-        self._url_field = NSTextField.alloc().initWithFrame_(
-            NSMakeRect(140, y_pos - 4, 340, 24)
-        )
+        subviews.append(self._create_label("Base URL:", _LAYOUT["url_label"]))
+
+        self._url_field = NSTextField.alloc().initWithFrame_(_LAYOUT["url_field"])
         self._url_field.setBezelStyle_(NSTextFieldSquareBezel)
         self._url_field.setStringValue_("https://api.example.com/v1")
-        content.addSubview_(self._url_field)
-        
-        y_pos -= 40
-        
+        subviews.append(self._url_field)
+
         # API Key
-        key_label = self._create_label("API Key:", 20, y_pos)
-        content.addSubview_(key_label)
-        
-        self._key_field = NSSecureTextField.alloc().initWithFrame_(
-            NSMakeRect(140, y_pos - 4, 340, 24)
-        )
+        subviews.append(self._create_label("API Key:", _LAYOUT["key_label"]))
+
+        self._key_field = NSSecureTextField.alloc().initWithFrame_(_LAYOUT["key_field"])
         self._key_field.setBezelStyle_(NSTextFieldSquareBezel)
-        content.addSubview_(self._key_field)
-        
-        y_pos -= 40
-        
+        subviews.append(self._key_field)
+
         # Default Model
-        model_label = self._create_label("Default Model:", 20, y_pos)
-        content.addSubview_(model_label)
-        
-        self._model_field = NSTextField.alloc().initWithFrame_(
-            NSMakeRect(140, y_pos - 4, 340, 24)
-        )
+        subviews.append(self._create_label("Default Model:", _LAYOUT["model_label"]))
+
+        self._model_field = NSTextField.alloc().initWithFrame_(_LAYOUT["model_field"])
         self._model_field.setBezelStyle_(NSTextFieldSquareBezel)
         self._model_field.setStringValue_("gpt-3.5-turbo")
-        content.addSubview_(self._model_field)
-        
-        y_pos -= 50
-        
+        subviews.append(self._model_field)
+
         # Buttons
-        self._test_btn = NSButton.alloc().initWithFrame_(
-            NSMakeRect(20, y_pos, 100, 28)
-        )
+        self._test_btn = NSButton.alloc().initWithFrame_(_LAYOUT["test_btn"])
         self._test_btn.setTitle_("Test")
         self._test_btn.setBezelStyle_(NSBezelStyleRounded)
         self._test_btn.setTarget_(self)
         self._test_btn.setAction_("testConnection:")
-        content.addSubview_(self._test_btn)
-        
-        self._add_btn = NSButton.alloc().initWithFrame_(
-            NSMakeRect(280, y_pos, 90, 28)
-        )
+        subviews.append(self._test_btn)
+
+        self._add_btn = NSButton.alloc().initWithFrame_(_LAYOUT["add_btn"])
         self._add_btn.setTitle_("Add")
         self._add_btn.setBezelStyle_(NSBezelStyleRounded)
         self._add_btn.setTarget_(self)
         self._add_btn.setAction_("addService:")
-        content.addSubview_(self._add_btn)
-        
-        cancel_btn = NSButton.alloc().initWithFrame_(
-            NSMakeRect(380, y_pos, 90, 28)
-        )
+        subviews.append(self._add_btn)
+
+        cancel_btn = NSButton.alloc().initWithFrame_(_LAYOUT["close_btn"])
         cancel_btn.setTitle_("Close")
         cancel_btn.setBezelStyle_(NSBezelStyleRounded)
         cancel_btn.setTarget_(self)
         cancel_btn.setAction_("close:")
-        content.addSubview_(cancel_btn)
-        
-        y_pos -= 40
-        
+        subviews.append(cancel_btn)
+
         # Existing services section
-        sep = NSView.alloc().initWithFrame_(
-            NSMakeRect(20, y_pos, 460, 1)
-        )
+        sep = NSView.alloc().initWithFrame_(_LAYOUT["separator"])
         sep.setWantsLayer_(True)
         sep.layer().setBackgroundColor_(NSColor.separatorColor().CGColor())
-        content.addSubview_(sep)
-        
-        y_pos -= 30
-        
-        existing_label = NSTextField.alloc().initWithFrame_(
-            NSMakeRect(20, y_pos, 460, 20)
-        )
+        subviews.append(sep)
+
+        existing_label = NSTextField.alloc().initWithFrame_(_LAYOUT["existing_label"])
         existing_label.setStringValue_("Configured API Services")
-        existing_label.setBezeled_(False)
-        existing_label.setDrawsBackground_(False)
-        existing_label.setEditable_(False)
-        existing_label.setFont_(NSFont.boldSystemFontOfSize_(14))
-        content.addSubview_(existing_label)
-        
+        _configure_label(existing_label, _HEADER_FONT)
+        subviews.append(existing_label)
+
         # Services list
-        y_pos -= 80
-        self._services_list = self._create_services_list(20, y_pos, 460, 70)
-        content.addSubview_(self._services_list)
+        self._services_list = self._create_services_list(*_LAYOUT["services_list"])
+        subviews.append(self._services_list)
+
+        # Install everything in one pass; setSubviews_ preserves list order
+        # and issues a single hierarchy update instead of one per addSubview_.
+        content.setSubviews_(subviews)
     
-    def _create_label(self, text, x, y):
+    def _create_label(self, text, frame):
         """Create a label."""
-        label = NSTextField.alloc().initWithFrame_(
-            NSMakeRect(x, y - 2, 110, 20)
-        )
+        label = NSTextField.alloc().initWithFrame_(frame)
         label.setStringValue_(text)
-        label.setBezeled_(False)
-        label.setDrawsBackground_(False)
-        label.setEditable_(False)
-        label.setFont_(NSFont.systemFontOfSize_(12))
+        _configure_label(label, _LABEL_FONT)
         return label
     
     def _create_services_list(self, x, y, width, height):
@@ -235,9 +238,10 @@ class APIConfigDialog(NSObject):
         
         services = self._manager.get_all_services()
         y_offset = height - 30
+        rows = []
         
         for service_id, service in services.items():
-            if service_id in PREDEFINED_APIS:
+            if service_id in _PREDEFINED:
                 continue  # Skip predefined
             
             # Service name
@@ -245,10 +249,8 @@ class APIConfigDialog(NSObject):
                 NSMakeRect(10, y_offset, 200, 20)
             )
             name.setStringValue_(service.name)
-            name.setBezeled_(False)
-            name.setDrawsBackground_(False)
-            name.setEditable_(False)
-            container.addSubview_(name)
+            _configure_label(name, _LABEL_FONT)
+            rows.append(name)
             
             # Delete button
             delete_btn = NSButton.alloc().initWithFrame_(
@@ -261,7 +263,7 @@ class APIConfigDialog(NSObject):
             delete_btn.setTarget_(self)
             delete_btn.setAction_("removeService:")
             delete_btn.setTag_(hash(service_id) % 10000)  # Simple tag
-            container.addSubview_(delete_btn)
+            rows.append(delete_btn)
             
             y_offset -= 25
         
@@ -271,6 +273,7 @@ class APIConfigDialog(NSObject):
             frame.size.height = height - y_offset
             container.setFrame_(frame)
         
+        container.setSubviews_(rows)
         scroll.setDocumentView_(container)
         return scroll
     
@@ -309,10 +312,13 @@ class APIConfigDialog(NSObject):
         
         # Test connection
         success, message = self._manager.test_connection("temp_test")
-        
-        # Clean up temp key
+
+        # Clean up temp key and drop the plaintext copy immediately
+        # rather than waiting for GC; the field keeps its value so a
+        # following Add still sees the key
         self._manager._keychain.delete_api_key("temp_test")
-        
+        del key
+
         if success:
             self._show_alert("Success", message)
         else:
@@ -343,7 +349,10 @@ class APIConfigDialog(NSObject):
             api_format=api_format,
             default_model=model or None
         )
-        
+
+        # The key is in the keychain now; drop the plaintext reference
+        del key
+
         if service:
             self._show_alert("Success", f"Added {service.name}")
             
@@ -368,8 +377,8 @@ class APIConfigDialog(NSObject):
         tag = sender.tag()
         
         # For simplicity, show all custom services and let user pick
-        custom = [s for s in self._manager.get_all_services().values() 
-                  if s.id not in PREDEFINED_APIS]
+        custom = [s for s in self._manager.get_all_services().values()
+                  if s.id not in _PREDEFINED]
         
         if custom:
             # Remove the first one for now (in real UI, use proper identification)
@@ -388,6 +397,24 @@ class APIConfigDialog(NSObject):
         """Close the dialog."""
         self._window.close()
     
+    def windowWillClose_(self, notification):
+        """Break window <-> dialog reference cycles so closed dialogs free."""
+        global _dialog_instance
+        if _dialog_instance is self:
+            _dialog_instance = None
+        # Zero the key field so the plaintext doesn't outlive the dialog
+        if self._key_field is not None:
+            self._key_field.setStringValue_("")
+        self._name_field = None
+        self._url_field = None
+        self._key_field = None
+        self._model_field = None
+        self._format_popup = None
+        self._services_list = None
+        self._test_btn = None
+        self._add_btn = None
+        self._window = None
+    
     def _show_alert(self, title, message):
         """Show an alert dialog."""
         alert = NSAlert.alloc().init()
@@ -398,17 +425,20 @@ class APIConfigDialog(NSObject):
         alert.runModal()
 
 
-# Global dialog instance
+# Strong reference keeping the open dialog alive (Cocoa delegates and
+# button targets are unretained); windowWillClose_ drops it so the
+# dialog frees as soon as its window closes.
 _dialog_instance = None
 
 def show_api_config(parent_window=None, on_complete=None):
     """
     Show the API configuration dialog.
-    
+
     Args:
         parent_window: Parent window for sheet presentation
         on_complete: Callback when dialog closes
     """
     global _dialog_instance
-    _dialog_instance = APIConfigDialog.alloc().init()
-    return _dialog_instance.show(parent_window, on_complete)
+    dialog = APIConfigDialog.alloc().init()
+    _dialog_instance = dialog
+    return dialog.show(parent_window, on_complete)
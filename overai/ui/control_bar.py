@@ -1,21 +1,23 @@
 """
 Control bar with accessible, Apple Design-compliant controls.
-Uses manual layout for reliable resizing.
+Uses autoresizing masks so AppKit repositions controls during resize.
 """
 
 import objc
 from Foundation import NSMakeRect, NSUserDefaults
 from AppKit import (
-    NSView, NSButton, NSPopUpButton, NSColor,
+    NSView, NSButton, NSPopUpButton, NSColor, NSMenuItem,
     NSBezelStyleRounded, NSBezelStyleRegularSquare,
-    NSImage
+    NSViewMinXMargin, NSViewWidthSizable
 )
 
+from ._symbol_cache import get_symbol
 from ..utils.logger import Logger
 from ..utils.theme import ThemeManager
 from ..utils.accessibility import AccessibilityManager
 from ..utils.haptics import get_haptics
 from .notifications import get_notification_manager
+from .webview_manager import AI_SERVICES, AIService
 from ..api.api_manager import get_api_manager
 
 logger = Logger("ControlBar")
@@ -39,6 +41,10 @@ class ControlBar(NSView):
     BUTTON_SPACING = 28
     SERVICE_SELECTOR_WIDTH = 110
     
+    # Fixed left-side frames, built once instead of per _setup_ui call
+    _CLOSE_FRAME = NSMakeRect(LEFT_MARGIN, 9, BUTTON_SIZE, BUTTON_SIZE)
+    _POPUP_FRAME = NSMakeRect(LEFT_MARGIN + 24 + 4, 7, SERVICE_SELECTOR_WIDTH + 20, 24)
+    
     def initWithFrame_(self, frame):
         self = objc.super(ControlBar, self).initWithFrame_(frame)
         if self is None:
@@ -59,12 +65,24 @@ class ControlBar(NSView):
         self._quit_btn = None
         self._bottom_border = None
         
-        # Disable autoresizing for subviews - we handle layout manually
-        self.setAutoresizesSubviews_(False)
+        # Let AppKit reposition subviews natively via autoresizing masks
+        self.setAutoresizesSubviews_(True)
         
         # Callback for API config
         self._api_config_callback = None
         
+        # Memoized merge of web + API services, keyed by the API service
+        # set so it invalidates when the configuration changes
+        self._services_cache = None
+        self._services_cache_token = None
+        
+        # Signature of the data behind the service menu, to skip
+        # no-op rebuilds in refresh_services
+        self._menu_signature = ()
+        
+        # service_id -> menu index, rebuilt with the menu
+        self._service_index_map = {}
+        
         self._setup_ui()
         
         return self
@@ -77,27 +95,24 @@ class ControlBar(NSView):
         self.setWantsLayer_(True)
         self.layer().setBackgroundColor_(NSColor.clearColor().CGColor())
         
-        # Bottom border (full width)
+        # Bottom border (full width, stretches with the bar)
         self._bottom_border = self._create_border(
             NSMakeRect(0, 0, bounds.size.width, 1)
         )
-        self.addSubview_(self._bottom_border)
+        self._bottom_border.setAutoresizingMask_(NSViewWidthSizable)
         
         # Left side controls
         self._close_btn = self._create_button(
-            NSMakeRect(self.LEFT_MARGIN, 9, self.BUTTON_SIZE, self.BUTTON_SIZE),
+            self._CLOSE_FRAME,
             "xmark.circle.fill",
             "closeClicked:",
             "Hide window",
             "Hide the OverAI overlay window",
             "Command+H"
         )
-        self.addSubview_(self._close_btn)
         
         # Service selector
-        self._service_popup = NSPopUpButton.alloc().initWithFrame_(
-            NSMakeRect(self.LEFT_MARGIN + 24 + 4, 7, self.SERVICE_SELECTOR_WIDTH + 20, 24)
-        )
+        self._service_popup = NSPopUpButton.alloc().initWithFrame_(self._POPUP_FRAME)
         self._service_popup.setBezelStyle_(NSBezelStyleRounded)
         
         self._refresh_service_menu()
@@ -107,29 +122,33 @@ class ControlBar(NSView):
         self._accessibility.configure_popUpButton(
             self._service_popup, "AI Service Selector", "Select which AI service to use"
         )
-        self.addSubview_(self._service_popup)
         
-        # Right side controls (will be positioned in layout)
+        # Right side controls - anchored to the right edge via
+        # NSViewMinXMargin so AppKit keeps them pinned during resize
+        quit_x = bounds.size.width - self.RIGHT_MARGIN - self.BUTTON_SIZE
+        increase_x = quit_x - self.BUTTON_SPACING
+        decrease_x = increase_x - self.BUTTON_SPACING
+        
         self._decrease_btn = self._create_button(
-            NSMakeRect(0, 9, self.BUTTON_SIZE, self.BUTTON_SIZE),  # Position set in layout
+            NSMakeRect(decrease_x, 9, self.BUTTON_SIZE, self.BUTTON_SIZE),
             "minus.circle",
             "decreaseOpacity:",
             "Decrease transparency",
             "Make window more transparent"
         )
-        self.addSubview_(self._decrease_btn)
+        self._decrease_btn.setAutoresizingMask_(NSViewMinXMargin)
         
         self._increase_btn = self._create_button(
-            NSMakeRect(0, 9, self.BUTTON_SIZE, self.BUTTON_SIZE),  # Position set in layout
+            NSMakeRect(increase_x, 9, self.BUTTON_SIZE, self.BUTTON_SIZE),
             "plus.circle",
             "increaseOpacity:",
             "Increase transparency",
             "Make window less transparent"
         )
-        self.addSubview_(self._increase_btn)
+        self._increase_btn.setAutoresizingMask_(NSViewMinXMargin)
         
         self._quit_btn = self._create_button(
-            NSMakeRect(0, 9, self.BUTTON_SIZE, self.BUTTON_SIZE),  # Position set in layout
+            NSMakeRect(quit_x, 9, self.BUTTON_SIZE, self.BUTTON_SIZE),
             "power",
             "quitClicked:",
             "Quit application",
@@ -137,10 +156,17 @@ class ControlBar(NSView):
             "Command+Q"
         )
         self._quit_btn.setContentTintColor_(NSColor.systemRedColor())
-        self.addSubview_(self._quit_btn)
-        
-        # Initial layout
-        self._layout_controls(self.bounds().size.width)
+        self._quit_btn.setAutoresizingMask_(NSViewMinXMargin)
+        
+        # Install all controls with a single hierarchy update
+        self.setSubviews_([
+            self._bottom_border,
+            self._close_btn,
+            self._service_popup,
+            self._decrease_btn,
+            self._increase_btn,
+            self._quit_btn,
+        ])
     
     def _create_border(self, frame):
         """Create a separator border."""
@@ -155,9 +181,8 @@ class ControlBar(NSView):
         btn.setBezelStyle_(NSBezelStyleRegularSquare)
         btn.setBordered_(False)
         
-        image = NSImage.imageWithSystemSymbolName_accessibilityDescription_(icon, label)
+        image = get_symbol(icon, size=16, description=label)
         if image:
-            image.setSize_((16, 16))
             btn.setImage_(image)
         
         btn.setTarget_(self)
@@ -165,58 +190,28 @@ class ControlBar(NSView):
         self._accessibility.configure_button(btn, label, help_text, shortcut)
         return btn
     
-    def _layout_controls(self, width):
-        """Position all controls based on current width."""
-        # Right side buttons - anchored to right edge
-        right_x = width - self.RIGHT_MARGIN - self.BUTTON_SIZE
-        
-        frame = self._quit_btn.frame()
-        frame.origin.x = right_x
-        self._quit_btn.setFrame_(frame)
-        
-        right_x -= self.BUTTON_SPACING
-        frame = self._increase_btn.frame()
-        frame.origin.x = right_x
-        self._increase_btn.setFrame_(frame)
-        
-        right_x -= self.BUTTON_SPACING
-        frame = self._decrease_btn.frame()
-        frame.origin.x = right_x
-        self._decrease_btn.setFrame_(frame)
-        
-        # Bottom border - full width
-        frame = self._bottom_border.frame()
-        frame.size.width = width
-        self._bottom_border.setFrame_(frame)
-    
-    def resizeSubviewsWithOldSize_(self, old_size):
-        """Called when view is resized - reposition right-side controls."""
-        new_width = self.bounds().size.width
-        self._layout_controls(new_width)
-    
-    def setFrame_(self, frame):
-        """Handle frame changes."""
-        objc.super(ControlBar, self).setFrame_(frame)
-        self._layout_controls(frame.size.width)
-    
     def _get_services(self):
         """Get available services including API-based ones."""
-        from .webview_manager import AI_SERVICES
+        api_services = get_api_manager().get_all_services()
+        
+        # Reuse the merged dict while the API service set is unchanged
+        token = tuple(sorted(api_services))
+        if self._services_cache is not None and token == self._services_cache_token:
+            return self._services_cache
         
         # Combine web services with API services
         all_services = dict(AI_SERVICES)
         
-        # Add API services
-        api_manager = get_api_manager()
-        for service_id, service in api_manager.get_all_services().items():
+        for service_id, service in api_services.items():
             # Convert API service to webview service format
-            from .webview_manager import AIService
             all_services[service_id] = AIService(
                 name=service.name,
                 url="about:blank",  # API services use blank page
                 icon=service.icon
             )
         
+        self._services_cache = all_services
+        self._services_cache_token = token
         return all_services
     
     # MARK: - Actions
@@ -289,6 +284,13 @@ class ControlBar(NSView):
     
     def refresh_services(self):
         """Refresh the service dropdown (called after API config changes)."""
+        self._services_cache = None
+        self._services_cache_token = None
+        
+        # Skip the rebuild entirely when the service set is unchanged
+        if self._compute_menu_signature() == self._menu_signature:
+            return
+        
         # Save current selection
         current = None
         if self._service_popup.indexOfSelectedItem() >= 0:
@@ -304,16 +306,22 @@ class ControlBar(NSView):
         if current:
             self.set_selected_service(current)
     
+    def _compute_menu_signature(self):
+        """Signature of the service data the menu is built from."""
+        api_services = get_api_manager().get_all_services()
+        return tuple(AI_SERVICES) + ("__sep__",) + tuple(sorted(api_services))
+    
     def _refresh_service_menu(self):
         """Rebuild the service menu with web services and Local AI."""
-        from .webview_manager import AI_SERVICES
-        from AppKit import NSMenuItem
+        self._menu_signature = self._compute_menu_signature()
+        self._service_index_map = {}
         
         # Web Services first
         for service_id, service in AI_SERVICES.items():
             self._service_popup.addItemWithTitle_(service.name)
             item = self._service_popup.lastItem()
             item.setRepresentedObject_(service_id)
+            self._service_index_map[service_id] = self._service_popup.numberOfItems() - 1
         
         # Add proper separator
         self._service_popup.menu().addItem_(NSMenuItem.separatorItem())
@@ -322,22 +330,22 @@ class ControlBar(NSView):
         self._service_popup.addItemWithTitle_("🏠 Local AI")
         item = self._service_popup.lastItem()
         item.setRepresentedObject_("local_ai")
+        self._service_index_map["local_ai"] = self._service_popup.numberOfItems() - 1
     
     def set_selected_service(self, service_id):
         """Set the selected service."""
-        for i in range(self._service_popup.numberOfItems()):
-            item = self._service_popup.itemAtIndex_(i)
-            if item.representedObject() == service_id:
-                self._service_popup.selectItemAtIndex_(i)
-                break
+        index = self._service_index_map.get(service_id)
+        if index is not None:
+            self._service_popup.selectItemAtIndex_(index)
     
     def _save_last_service(self, service_id):
         """Save last used service to UserDefaults."""
         try:
+            # No synchronize(): macOS persists user defaults lazily, and a
+            # forced flush blocks the main thread on disk I/O per switch
             defaults = NSUserDefaults.standardUserDefaults()
             defaults.setObject_forKey_(service_id, LAST_SERVICE_KEY)
-            defaults.synchronize()
-            logger.debug(f"Saved last service: {service_id}")
+            logger.debug("Saved last service: %s", service_id)
         except Exception as e:
             logger.error(f"Failed to save last service: {e}")
     
@@ -354,6 +362,6 @@ class ControlBar(NSView):
         """Select and return the last used service. Call after setup."""
         service_id = self.get_last_service()
         self.set_selected_service(service_id)
-        logger.info(f"Restored last service: {service_id}")
+        logger.info("Restored last service: %s", service_id)
         return service_id
 
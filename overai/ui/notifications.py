@@ -4,7 +4,9 @@ Shows subtle pill-shaped notifications for service switching and other events.
 """
 
 import objc
-from Foundation import NSObject, NSTimer, NSMakeRect, CGPoint, CGRect
+from Foundation import (
+    NSObject, NSTimer, NSMakeRect, CGPoint, CGRect, NSNotificationCenter
+)
 from AppKit import (
     NSWindow, NSView, NSColor, NSFont, NSTextField, 
     NSVisualEffectView, NSVisualEffectMaterialMenu, NSBezierPath,
@@ -12,8 +14,10 @@ from AppKit import (
     NSViewWidthSizable, NSViewHeightSizable,
     NSAnimationContext, NSImage, NSImageView
 )
-from AppKit import NSStatusWindowLevel
+from AppKit import NSStatusWindowLevel, NSScreen
+from PyObjCTools import AppHelper
 
+from ._symbol_cache import get_symbol
 from ..utils.logger import Logger
 
 logger = Logger("Notifications")
@@ -30,6 +34,15 @@ class DynamicIslandNotification(NSObject):
     PILL_CORNER_RADIUS = 22.0
     DISPLAY_DURATION = 2.0  # Seconds to show
     ANIMATION_DURATION = 0.3
+    IDLE_CLEANUP_DELAY = 60.0  # Free AppKit views after this much idle time
+    
+    # Immutable color singletons, resolved once per process
+    _WHITE = NSColor.whiteColor()
+    _WHITE_20_CG = NSColor.whiteColor().colorWithAlphaComponent_(0.2).CGColor()
+    
+    # Fixed subview frames, built once instead of per _setup_content call
+    _ICON_FRAME = NSMakeRect(14, 10, 24, 24)
+    _TEXT_FRAME = NSMakeRect(42, 10, WIDTH - 56, 24)
     
     def init(self):
         self = objc.super(DynamicIslandNotification, self).init()
@@ -41,20 +54,41 @@ class DynamicIslandNotification(NSObject):
         self._icon_view = None
         self._text_field = None
         self._hide_timer = None
+        self._cleanup_timer = None
         self._is_showing = False
         
+        # Last displayed content, to skip redundant field updates
+        self._last_message = None
+        self._last_icon_name = None
+        
+        # Cached top-center origin; recomputed only when the screen
+        # configuration changes
+        self._cached_origin = None
+        NSNotificationCenter.defaultCenter().addObserver_selector_name_object_(
+            self,
+            "screenParametersChanged:",
+            "NSApplicationDidChangeScreenParametersNotification",
+            None
+        )
+        
         return self
     
+    def screenParametersChanged_(self, notification):
+        """Invalidate the cached origin when displays change."""
+        self._cached_origin = None
+    
     def _create_window(self):
         """Create the notification window."""
-        from AppKit import NSScreen
+        if self._cached_origin is None:
+            screen_frame = NSScreen.mainScreen().frame()
+            
+            # Center at top of screen (60px from top)
+            self._cached_origin = (
+                (screen_frame.size.width - self.WIDTH) / 2,
+                screen_frame.size.height - 60
+            )
         
-        screen = NSScreen.mainScreen()
-        screen_frame = screen.frame()
-        
-        # Center at top of screen
-        x = (screen_frame.size.width - self.WIDTH) / 2
-        y = screen_frame.size.height - 60  # 60px from top
+        x, y = self._cached_origin
         
         window = NSWindow.alloc().initWithContentRect_styleMask_backing_defer_(
             NSMakeRect(x, y, self.WIDTH, self.HEIGHT),
@@ -90,64 +124,61 @@ class DynamicIslandNotification(NSObject):
         
         # Add subtle border
         visual.layer().setBorderWidth_(0.5)
-        visual.layer().setBorderColor_(
-            NSColor.whiteColor().colorWithAlphaComponent_(0.2).CGColor()
-        )
+        visual.layer().setBorderColor_(self._WHITE_20_CG)
         
         window.contentView().addSubview_(visual)
         
         # Icon (left side)
-        self._icon_view = NSImageView.alloc().initWithFrame_(
-            NSMakeRect(14, 10, 24, 24)
-        )
+        self._icon_view = NSImageView.alloc().initWithFrame_(self._ICON_FRAME)
         self._icon_view.setImageScaling_(1)  # NSImageScaleProportionallyDown
-        visual.addSubview_(self._icon_view)
         
         # Text (center)
-        self._text_field = NSTextField.alloc().initWithFrame_(
-            NSMakeRect(42, 10, self.WIDTH - 56, 24)
-        )
+        self._text_field = NSTextField.alloc().initWithFrame_(self._TEXT_FRAME)
         self._text_field.setBezeled_(False)
         self._text_field.setDrawsBackground_(False)
         self._text_field.setEditable_(False)
         self._text_field.setSelectable_(False)
-        self._text_field.setTextColor_(NSColor.whiteColor())
+        self._text_field.setTextColor_(self._WHITE)
         self._text_field.setFont_(NSFont.systemFontOfSize_(14))
         self._text_field.setAlignment_(1)  # NSCenterTextAlignment
-        visual.addSubview_(self._text_field)
+        
+        # One hierarchy update for both children
+        visual.setSubviews_([self._icon_view, self._text_field])
         
         self._content_view = visual
     
     def displayNotification_icon_duration_(self, message: str, icon_name: str, duration: float):
         
+        # Cancel any pending idle teardown; the window is needed again
+        if self._cleanup_timer:
+            self._cleanup_timer.invalidate()
+            self._cleanup_timer = None
+        
         # Create window if needed
         if not self._window:
             self._create_window()
         
-        # Update content
-        self._text_field.setStringValue_(message)
-        
-        # Set icon
-        icon = NSImage.imageWithSystemSymbolName_accessibilityDescription_(
-            icon_name, message
-        )
-        if icon:
-            icon.setTintColor_(NSColor.whiteColor())
-            self._icon_view.setImage_(icon)
+        # Update content only when it actually changed; identical
+        # re-displays (e.g. opacity clamped at 100%) skip text layout
+        if message != self._last_message:
+            self._text_field.setStringValue_(message)
+            self._last_message = message
         
-        # Cancel any existing timer
-        if self._hide_timer:
-            self._hide_timer.invalidate()
-            self._hide_timer = None
+        if icon_name != self._last_icon_name:
+            # Cached per symbol with the white tint baked in
+            icon = get_symbol(icon_name, tint=self._WHITE)
+            if icon:
+                self._icon_view.setImage_(icon)
+                self._last_icon_name = icon_name
         
         # Show window with animation
         self._window.setAlphaValue_(0.0)
         self._window.orderFront_(None)
         
-        # Spring animation for appearance
+        # Spring animation for appearance; bound methods avoid a fresh
+        # lambda + closure allocation per display
         NSAnimationContext.runAnimationGroup_completionHandler_(
-            lambda ctx: self._setup_show_animation(ctx),
-            None
+            self._setup_show_animation, None
         )
         
         self._is_showing = True
@@ -165,30 +196,24 @@ class DynamicIslandNotification(NSObject):
         self._content_view.animator().setFrameOrigin_((0, 0))
     
     def _schedule_hide(self, duration: float):
-        """Schedule auto-hide using performSelector."""
-        from Foundation import NSObject
-        NSObject.cancelPreviousPerformRequestsWithTarget_selector_object_(
-            self, "hideNotification", None
-        )
-        self.performSelector_withObject_afterDelay_(
-            "hideNotification", None, duration
+        """Schedule auto-hide with a single re-armed NSTimer."""
+        if self._hide_timer:
+            self._hide_timer.invalidate()
+        self._hide_timer = NSTimer.scheduledTimerWithTimeInterval_target_selector_userInfo_repeats_(
+            duration, self, "hideNotification:", None, False
         )
     
-    def hideNotification(self):
-        """Auto-hide after delay - called by performSelector."""
-        self.hideNotification_()
-    
     def hideNotification_(self, sender=None):
         """Hide the notification with animation."""
         if not self._is_showing or not self._window:
             return
         
         self._is_showing = False
+        self._hide_timer = None
         
         # Spring animation for disappearance
         NSAnimationContext.runAnimationGroup_completionHandler_(
-            lambda ctx: self._setup_hide_animation(ctx),
-            lambda: self._complete_hide()
+            self._setup_hide_animation, self._complete_hide
         )
     
     def _setup_hide_animation(self, context):
@@ -200,6 +225,26 @@ class DynamicIslandNotification(NSObject):
         """Complete hide operation."""
         if self._window:
             self._window.orderOut_(None)
+        
+        # The notification is invisible most of the time; drop the window
+        # and its views if it stays idle, _create_window rebuilds lazily
+        if self._cleanup_timer:
+            self._cleanup_timer.invalidate()
+        self._cleanup_timer = NSTimer.scheduledTimerWithTimeInterval_target_selector_userInfo_repeats_(
+            self.IDLE_CLEANUP_DELAY, self, "destroyIdleWindow:", None, False
+        )
+    
+    def destroyIdleWindow_(self, timer):
+        """Free the AppKit view hierarchy after a long idle period."""
+        self._cleanup_timer = None
+        if self._is_showing:
+            return
+        self._window = None
+        self._content_view = None
+        self._icon_view = None
+        self._text_field = None
+        self._last_message = None
+        self._last_icon_name = None
 
 
 class NotificationManager:
@@ -207,36 +252,55 @@ class NotificationManager:
     Manager for showing various types of notifications.
     """
     
+    # Shared read-only icon mapping for the singleton manager
+    _SERVICE_ICONS = {
+        "grok": "bolt.fill",
+        "chatgpt": "bubble.left.fill",
+        "claude": "quote.bubble.fill",
+        "gemini": "sparkles",
+        "deepseek": "magnifyingglass",
+        "perplexity": "magnifyingglass.circle"
+    }
+    
     def __init__(self):
         self._notification = DynamicIslandNotification.alloc().init()
-        self._service_icons = {
-            "grok": "bolt.fill",
-            "chatgpt": "bubble.left.fill",
-            "claude": "quote.bubble.fill",
-            "gemini": "sparkles",
-            "deepseek": "magnifyingglass",
-            "perplexity": "magnifyingglass.circle"
-        }
+        
+        # Latest pending notification; rapid bursts (e.g. a held opacity
+        # key) coalesce into a single display per runloop tick
+        self._pending = None
+        self._flush_scheduled = False
+    
+    def _enqueue(self, message: str, icon: str, duration: float):
+        """Queue a notification, coalescing bursts into one display."""
+        self._pending = (message, icon, duration)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            AppHelper.callLater(0.016, self._flush_pending)
+    
+    def _flush_pending(self):
+        """Display the most recent pending notification."""
+        self._flush_scheduled = False
+        if self._pending is None:
+            return
+        message, icon, duration = self._pending
+        self._pending = None
+        self._notification.displayNotification_icon_duration_(message, icon, duration)
     
     def show_service_switch(self, service_name: str, service_id: str):
         """Show notification when switching AI services."""
-        icon = self._service_icons.get(service_id, "info.circle.fill")
-        self._notification.displayNotification_icon_duration_(
+        icon = self._SERVICE_ICONS.get(service_id, "info.circle.fill")
+        self._enqueue(
             f"Switched to {service_name}", icon, self._notification.DISPLAY_DURATION
         )
     
     def show_opacity_change(self, opacity: float):
         """Show notification when opacity changes."""
         percentage = int(opacity * 100)
-        self._notification.displayNotification_icon_duration_(
-            f"Opacity: {percentage}%", "eye.fill", 1.0
-        )
+        self._enqueue(f"Opacity: {percentage}%", "eye.fill", 1.0)
     
     def show_message(self, message: str, icon: str = "info.circle.fill"):
         """Show a custom message."""
-        self._notification.displayNotification_icon_duration_(
-            message, icon, self._notification.DISPLAY_DURATION
-        )
+        self._enqueue(message, icon, self._notification.DISPLAY_DURATION)
 
 
 # Global instance
@@ -0,0 +1,361 @@
+(function() {
+    'use strict';
+    
+    // Model list injected by the native side via WKUserScript
+    const MODELS = Array.isArray(window.MODELS) ? window.MODELS : [];
+    const MAX_MESSAGES = 20; // Limit chat history for memory
+    
+    let currentModel = '';
+    let busy = false;
+
+    // Chat history as a fixed-size ring buffer: O(1) per message,
+    // no slice() reallocation when trimming
+    const msgs = new Array(MAX_MESSAGES);
+    let head = 0;   // next write slot
+    let count = 0;  // messages currently stored
+    let liveCount = 0;  // message bubbles currently in the DOM
+
+    function getEl(id) { return document.getElementById(id); }
+
+    // Markdown rules compiled once at script init; regex literals inside
+    // receiveResponse would be re-created per response
+    const MD_RULES = [
+        // Code blocks first (before other formatting)
+        [/```(\w*)\n([\s\S]*?)```/g, '<pre><code>$2</code></pre>'],
+        // Inline code
+        [/`([^`]+)`/g, '<code>$1</code>'],
+        // Bold
+        [/\*\*([^*]+)\*\*/g, '<strong>$1</strong>'],
+        [/__([^_]+)__/g, '<strong>$1</strong>'],
+        // Italic
+        [/\*([^*]+)\*/g, '<em>$1</em>'],
+        [/_([^_]+)_/g, '<em>$1</em>'],
+        // Headers
+        [/^### (.+)$/gm, '<h4>$1</h4>'],
+        [/^## (.+)$/gm, '<h3>$1</h3>'],
+        [/^# (.+)$/gm, '<h3>$1</h3>'],
+        // Lists
+        [/^[*-] (.+)$/gm, '<li>$1</li>'],
+        [/^(\d+)\. (.+)$/gm, '<li>$2</li>'],
+        // Line breaks
+        [/\n/g, '<br>']
+    ];
+
+    function renderMarkdown(text) {
+        for (let i = 0; i < MD_RULES.length; i++) {
+            text = text.replace(MD_RULES[i][0], MD_RULES[i][1]);
+        }
+        return text;
+    }
+
+    // Markdown worker: the regex passes run off the main thread so long
+    // responses don't block typing or scrolling. The worker source is
+    // generated from MD_RULES to keep the rule set in one place.
+    let mdWorker = null;
+    try {
+        const rulesSrc = '[' + MD_RULES.map(function(r) {
+            return '[' + r[0].toString() + ',' + JSON.stringify(r[1]) + ']';
+        }).join(',') + ']';
+        const workerSrc =
+            'const R=' + rulesSrc + ';' +
+            'self.onmessage=function(e){' +
+            'let t=e.data;' +
+            'for(let i=0;i<R.length;i++)t=t.replace(R[i][0],R[i][1]);' +
+            'postMessage(t);};';
+        mdWorker = new Worker(URL.createObjectURL(
+            new Blob([workerSrc], { type: 'application/javascript' })
+        ));
+    } catch (e) {
+        mdWorker = null;  // fall back to main-thread rendering
+    }
+
+    // Bubble structure parsed once; clones skip the innerHTML parser
+    // and textContent makes manual &/</> escaping unnecessary
+    const BUBBLE_TPL = document.createElement('template');
+    BUBBLE_TPL.innerHTML = '<div class="message"><div class="bubble"></div></div>';
+
+    function makeBubble(kind) {
+        const node = BUBBLE_TPL.content.firstChild.cloneNode(true);
+        node.classList.add(kind, 'single');
+        return node;
+    }
+
+    function pushMsg(m) {
+        msgs[head] = m;
+        head = (head + 1) % MAX_MESSAGES;
+        if (count < MAX_MESSAGES) count++;
+    }
+
+    function resetMsgs() {
+        msgs.length = 0;
+        msgs.length = MAX_MESSAGES;
+        head = 0;
+        count = 0;
+    }
+
+    // Materialize the ring buffer in chronological order for the API
+    function historyInOrder() {
+        const out = new Array(count);
+        const start = (head - count + MAX_MESSAGES) % MAX_MESSAGES;
+        for (let i = 0; i < count; i++) {
+            out[i] = msgs[(start + i) % MAX_MESSAGES];
+        }
+        return out;
+    }
+    
+    function init() {
+        console.log('Local AI init started, models:', MODELS.length);
+        
+        const modelSelect = getEl('modelSelect');
+        const statusText = getEl('statusText');
+        const welcomeText = getEl('welcomeText');
+        const statusDot = getEl('statusDot');
+        const userInput = getEl('input');
+        const sendBtn = getEl('sendBtn');
+        const messagesArea = getEl('messages');
+        const welcome = getEl('welcome');
+        
+        if (!modelSelect || !messagesArea) {
+            console.error('DOM not ready, retrying...');
+            setTimeout(init, 100);
+            return;
+        }
+        
+        if (MODELS.length === 0) {
+            if (statusText) statusText.textContent = 'Offline';
+            if (statusDot) statusDot.className = 'status-dot';
+            if (welcomeText) welcomeText.textContent = 'No models found. Make sure Ollama is running.';
+            return;
+        }
+        
+        // Populate models via a fragment: one attach, one reflow
+        modelSelect.innerHTML = '';
+        const frag = document.createDocumentFragment();
+        MODELS.forEach(function(m) {
+            const opt = document.createElement('option');
+            opt.value = m.name;
+            opt.textContent = m.name.split(':')[0];
+            frag.appendChild(opt);
+        });
+        modelSelect.appendChild(frag);
+        
+        currentModel = MODELS[0].name;
+        modelSelect.disabled = false;
+        
+        // Update status
+        statusDot.className = 'status-dot online';
+        statusText.textContent = 'Connected';
+        
+        // Update welcome message
+        if (welcomeText) {
+            welcomeText.textContent = 'Type a message to start chatting with ' + currentModel.split(':')[0];
+        }
+        
+        // Enable input
+        userInput.disabled = false;
+        userInput.placeholder = 'Message';
+        sendBtn.disabled = false;
+        
+        // *** ATTACH EVENT HANDLERS HERE - AFTER DOM IS READY ***
+        // The welcome panel stays at index 0, so children[1] is always
+        // the oldest bubble — trimming is O(1), no tree scan
+        function appendMessage(node) {
+            node.classList.add('enter');
+            messagesArea.appendChild(node);
+            // Flip .enter off on the next frame so the transition runs
+            requestAnimationFrame(function() { node.classList.remove('enter'); });
+            if (++liveCount > MAX_MESSAGES) {
+                messagesArea.children[1].remove();
+                liveCount--;
+            }
+        }
+
+        modelSelect.onchange = function() {
+            currentModel = modelSelect.value;
+            resetMsgs();
+            // Clear messages and show welcome
+            if (welcome) welcome.style.display = 'flex';
+            if (welcomeText) welcomeText.textContent = 'Type a message to start chatting with ' + currentModel.split(':')[0];
+            // Remove all message bubbles (everything after the welcome panel)
+            while (messagesArea.children.length > 1) {
+                messagesArea.lastElementChild.remove();
+            }
+            liveCount = 0;
+        };
+        
+        sendBtn.onclick = function() {
+            const text = userInput.value.trim();
+            if (!text || busy || !currentModel) return;
+            
+            // Hide welcome
+            if (welcome) welcome.style.display = 'none';
+            
+            // Add user message (iMessage style - sent)
+            const userDiv = makeBubble('sent');
+            userDiv.firstChild.textContent = text;
+            appendMessage(userDiv);
+
+            pushMsg({ role: 'user', content: text });
+            userInput.value = '';
+            busy = true;
+            sendBtn.disabled = true;
+            
+            // Add AI typing indicator (iMessage style - received)
+            const aiDiv = makeBubble('received');
+            const aiBubble = aiDiv.firstChild;
+            aiBubble.id = 'currentBubble';
+            aiBubble.innerHTML = '<div class="typing"></div>';
+            appendMessage(aiDiv);
+            messagesArea.scrollTop = messagesArea.scrollHeight;
+            resetResponseState();
+
+            // Send to Python via webkit message handler
+            if (window.webkit && window.webkit.messageHandlers && window.webkit.messageHandlers.ollama) {
+                window.webkit.messageHandlers.ollama.postMessage({
+                    type: 'chat',
+                    model: currentModel,
+                    messages: historyInOrder()
+                });
+            } else {
+                getEl('currentBubble').innerHTML = 'Error: Message handler not available';
+                busy = false;
+                sendBtn.disabled = false;
+            }
+        };
+        
+        userInput.onkeydown = function(e) {
+            if (e.key === 'Enter' && !e.shiftKey) {
+                e.preventDefault();
+                sendBtn.onclick();
+            }
+        };
+        
+        // Autosize by measuring a hidden mirror div instead of the
+        // write-read-write scrollHeight cycle, which forced two
+        // synchronous layouts of the visible textarea per keystroke
+        const mirror = document.createElement('div');
+        mirror.className = 'ta-mirror';
+        document.body.appendChild(mirror);
+
+        userInput.oninput = function() {
+            mirror.style.width = this.clientWidth + 'px';
+            mirror.textContent = this.value + '\u200b';
+            this.style.height = Math.min(mirror.offsetHeight, 100) + 'px';
+        };
+        
+        userInput.focus();
+        console.log('Local AI init complete');
+    }
+    
+    // Response text waiting to be rendered; markdown runs in the worker
+    // when available and the DOM write is flushed at most once per frame
+    let pendingText = '';
+    let pendingHtml = null;  // null: render on main thread in the flush
+    let rafPending = false;
+    let awaitingWorker = false;
+    let workerDirty = false;
+    let staleWorker = false;  // in-flight worker reply is for an old response
+    let responseDone = false;
+
+    function flushResponse() {
+        rafPending = false;
+        const bubble = document.getElementById('currentBubble');
+        const messagesArea = getEl('messages');
+
+        if (bubble) {
+            bubble.innerHTML = pendingHtml !== null ? pendingHtml : renderMarkdown(pendingText);
+            // Only finalize once the flushed html matches the final text;
+            // a pending worker reply means this html is already stale
+            if (responseDone && !awaitingWorker && !workerDirty) {
+                bubble.removeAttribute('id');
+                pushMsg({ role: 'assistant', content: pendingText });
+                busy = false;
+                const sendBtn = getEl('sendBtn');
+                const userInput = getEl('input');
+                if (sendBtn) sendBtn.disabled = false;
+                if (userInput) userInput.focus();
+            }
+        }
+        if (messagesArea) messagesArea.scrollTop = messagesArea.scrollHeight;
+    }
+
+    function scheduleFlush() {
+        if (rafPending) return;
+        rafPending = true;
+        requestAnimationFrame(flushResponse);
+    }
+
+    function renderPending() {
+        if (mdWorker) {
+            if (awaitingWorker) {
+                workerDirty = true;
+                return;
+            }
+            awaitingWorker = true;
+            mdWorker.postMessage(pendingText);
+        } else {
+            pendingHtml = null;
+            scheduleFlush();
+        }
+    }
+
+    if (mdWorker) {
+        mdWorker.onmessage = function(ev) {
+            awaitingWorker = false;
+            if (staleWorker) {
+                // Reply belongs to a response that was reset; drop it and
+                // render the current text if any arrived in the meantime
+                staleWorker = false;
+                if (workerDirty) {
+                    workerDirty = false;
+                    awaitingWorker = true;
+                    mdWorker.postMessage(pendingText);
+                }
+                return;
+            }
+            pendingHtml = ev.data;
+            scheduleFlush();
+            // Newer text arrived while the worker was busy; re-render it
+            if (workerDirty) {
+                workerDirty = false;
+                awaitingWorker = true;
+                mdWorker.postMessage(pendingText);
+            }
+        };
+    }
+
+    // Streaming handlers from Python (must be global). Chunks append to
+    // the pending buffer; the done call finalizes the bubble.
+    window.receiveResponseChunk = function(chunk) {
+        pendingText += chunk;
+        renderPending();
+    };
+
+    window.receiveResponseDone = function() {
+        responseDone = true;
+        renderPending();
+    };
+
+    // Whole-response handler (error path / non-streaming fallback)
+    window.receiveResponse = function(response) {
+        pendingText = response;
+        responseDone = true;
+        renderPending();
+    };
+
+    function resetResponseState() {
+        pendingText = '';
+        pendingHtml = null;
+        responseDone = false;
+        workerDirty = false;
+        // A reply still in flight would carry html for the old response
+        staleWorker = awaitingWorker;
+    }
+    
+    // Start init when DOM is ready
+    if (document.readyState === 'loading') {
+        document.addEventListener('DOMContentLoaded', init);
+    } else {
+        init();
+    }
+})();
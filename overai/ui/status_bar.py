@@ -7,11 +7,14 @@ from typing import Callable, Optional
 import objc
 from Foundation import NSNotificationCenter
 from AppKit import (
+    NSApplication,
     NSStatusBar, NSMenu, NSMenuItem, NSImage,
-    NSSquareStatusItemLength, NSFont, NSAttributedString,
+    NSSquareStatusItemLength, NSVariableStatusItemLength,
+    NSFont, NSAttributedString,
     NSForegroundColorAttributeName, NSColor
 )
 
+from ._symbol_cache import get_symbol
 from ..utils.logger import Logger
 from ..constants import APP_VERSION
 
@@ -25,11 +28,11 @@ class StatusBarManager:
         self._status_item = None
         self._menu = None
         self._callbacks = {}
+        self._last_appearance = None
     
     def setup(self):
         """Setup status bar."""
         # Use Variable length for better compatibility
-        from AppKit import NSVariableStatusItemLength
         self._status_item = NSStatusBar.systemStatusBar().statusItemWithLength_(
             NSVariableStatusItemLength
         )
@@ -43,19 +46,25 @@ class StatusBarManager:
         if not self._status_item:
             return
         
+        # macOS can fire the theme notification more than once per
+        # transition; skip when the effective appearance didn't change
+        appearance = NSApplication.sharedApplication().effectiveAppearance().name()
+        if appearance == self._last_appearance:
+            return
+        self._last_appearance = appearance
+        
         # Use system symbol 'sparkles' (AI standard) for reliability
         # This avoids "white square" (solid icon) and "missing" (bad path) issues
-        image = NSImage.imageWithSystemSymbolName_accessibilityDescription_("sparkles", "OverAI")
+        image = get_symbol("sparkles", description="OverAI", template=True)
         
         if image:
-            image.setTemplate_(True)
             self._status_item.button().setImage_(image)
             self._status_item.button().setTitle_("")
             return
         
         # 3. Last resort: System Symbol (Always works)
         # Use a system symbol that looks like 'O'
-        fallback = NSImage.imageWithSystemSymbolName_accessibilityDescription_("circle.circle", "OverAI")
+        fallback = get_symbol("circle.circle", description="OverAI")
         if fallback:
             self._status_item.button().setImage_(fallback)
             self._status_item.button().setTitle_("")
@@ -76,27 +85,33 @@ class StatusBarManager:
         """Create clean Apple-style menu."""
         self._menu = NSMenu.alloc().init()
         
-        # App header
-        self._add_item(f"OverAI v{APP_VERSION}", enabled=False)
-        self._menu.addItem_(NSMenuItem.separatorItem())
-        
-        # Window controls
-        self._add_item("Show Window", "show:", "macwindow", "s")
-        self._add_item("Hide Window", "hide:", "eye.slash", "h")
-        self._add_item("Reload", "reload:", "arrow.clockwise", "r")
-        self._menu.addItem_(NSMenuItem.separatorItem())
+        items = [
+            # App header
+            self._make_item(f"OverAI v{APP_VERSION}", enabled=False),
+            NSMenuItem.separatorItem(),
+            # Window controls
+            self._make_item("Show Window", "show:", "macwindow", "s"),
+            self._make_item("Hide Window", "hide:", "eye.slash", "h"),
+            self._make_item("Reload", "reload:", "arrow.clockwise", "r"),
+            NSMenuItem.separatorItem(),
+            # Settings
+            self._make_item("Preferences…", "settings:", "gear", ","),
+            NSMenuItem.separatorItem(),
+            # Standard app items
+            self._make_item("About OverAI", "about:", "info.circle"),
+            self._make_item("Quit OverAI", "quit:", "power", "q"),
+        ]
         
-        # Settings
-        self._add_item("Preferences…", "settings:", "gear", ",")
-        self._menu.addItem_(NSMenuItem.separatorItem())
-        
-        # Standard app items
-        self._add_item("About OverAI", "about:", "info.circle")
-        self._add_item("Quit OverAI", "quit:", "power", "q")
+        # Install in one pass where the bulk setter is available
+        if self._menu.respondsToSelector_("setItemArray:"):
+            self._menu.setItemArray_(items)
+        else:
+            for item in items:
+                self._menu.addItem_(item)
     
-    def _add_item(self, title: str, action: str = None, icon: str = None, 
-                  shortcut: str = "", enabled: bool = True):
-        """Add menu item."""
+    def _make_item(self, title: str, action: str = None, icon: str = None, 
+                   shortcut: str = "", enabled: bool = True):
+        """Build a configured menu item."""
         item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
             title, action, shortcut
         )
@@ -107,11 +122,11 @@ class StatusBarManager:
         item.setEnabled_(enabled)
         
         if icon:
-            image = NSImage.imageWithSystemSymbolName_accessibilityDescription_(icon, title)
+            image = get_symbol(icon, description=title)
             if image:
                 item.setImage_(image)
         
-        self._menu.addItem_(item)
+        return item
     
     # MARK: - Actions
     
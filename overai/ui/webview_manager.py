@@ -4,11 +4,18 @@ Uses WKWebView with proper configuration for AI services.
 Optimized for low RAM usage with aggressive memory management.
 """
 import os
+import gzip
 import json
+import time
+import zlib
 import base64
+import threading
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Callable
-from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Optional, Dict, Callable, NamedTuple
 import objc
 from Foundation import (
     NSURL, NSURLRequest, NSObject, NSDate, NSNotificationCenter,
@@ -17,15 +24,56 @@ from Foundation import (
 from WebKit import (
     WKWebView, WKWebViewConfiguration, WKPreferences,
     WKWebsiteDataStore, WKUserScript, WKUserScriptInjectionTimeAtDocumentEnd,
-    WKUserContentController, WKProcessPool
+    WKUserScriptInjectionTimeAtDocumentStart,
+    WKUserContentController, WKProcessPool, WKContentRuleListStore
 )
 from AppKit import (
     NSMakeRect, NSViewWidthSizable, NSViewHeightSizable,
     NSApplication
 )
+from PyObjCTools import AppHelper
+
+from ..api.api_manager import get_api_manager
+from ..api.ollama_client import get_ollama_client
 from ..utils.logger import Logger
 from ..utils.theme import ThemeManager
 
+# Optional: memory pressure dispatch source (pyobjc-framework-libdispatch)
+try:
+    import libdispatch
+except ImportError:
+    libdispatch = None
+
+# httpx keeps connections alive between chat turns, skipping the
+# 50-200ms TCP+TLS handshake per request; urllib remains the fallback
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# orjson parses/serializes in C without the Python-level tokenizer;
+# fall back to the stdlib when it isn't installed
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dumps_bytes(obj):
+        return orjson.dumps(obj)
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj).decode('utf-8')
+except ImportError:
+    def _json_loads(data):
+        return json.loads(data)
+
+    def _json_dumps_bytes(obj):
+        return json.dumps(obj).encode('utf-8')
+
+    def _json_dumps(obj):
+        return json.dumps(obj)
+
 logger = Logger("WebViewManager")
 
 # Shared process pool to reduce memory across multiple webviews (if ever needed)
@@ -38,45 +86,175 @@ def get_shared_process_pool():
         _shared_process_pool = WKProcessPool.alloc().init()
     return _shared_process_pool
 
+# Bundled static resources for the Local AI page; loading them as files
+# lets WebKit parse them directly and reuse its own caches across loads
+_LOCAL_AI_RESOURCES = Path(__file__).parent / "resources" / "local_ai"
+
+# Theme-reporter source. matchMedia is constant-time, unlike the old
+# getComputedStyle read which forced a style flush during page load.
+_THEME_SCRIPT_SRC = """
+    (function() {
+        function post(color) {
+            if (window.webkit && window.webkit.messageHandlers && window.webkit.messageHandlers.themeHandler) {
+                window.webkit.messageHandlers.themeHandler.postMessage(color);
+            }
+        }
+        const mm = window.matchMedia('(prefers-color-scheme: dark)');
+        post(mm.matches ? 'rgb(0, 0, 0)' : 'rgb(255, 255, 255)');
+        mm.addEventListener('change', function(e) {
+            post(e.matches ? 'rgb(0, 0, 0)' : 'rgb(255, 255, 255)');
+        });
+    })();
+"""
+
+# Timer registry, injected at document start. Wrapping the timer APIs
+# lets suspend() clear exactly the live timers instead of brute-forcing
+# every id up to the current counter (O(millions) after long sessions).
+_TIMER_REGISTRY_SCRIPT_SRC = """
+    (function() {
+        const ids = new Set();
+        const st = window.setTimeout, si = window.setInterval;
+        const ct = window.clearTimeout, ci = window.clearInterval;
+        window.setTimeout = function() { const id = st.apply(window, arguments); ids.add(id); return id; };
+        window.setInterval = function() { const id = si.apply(window, arguments); ids.add(id); return id; };
+        window.clearTimeout = function(id) { ids.delete(id); return ct.call(window, id); };
+        window.clearInterval = function(id) { ids.delete(id); return ci.call(window, id); };
+        window.__overai_clearAllTimers = function() {
+            ids.forEach(function(id) { ct.call(window, id); ci.call(window, id); });
+            const n = ids.size;
+            ids.clear();
+            return n;
+        };
+    })();
+"""
+
+# Persistent native->page message entry point, installed at document
+# start. Pushes from Python become a short `__overai.recv(...)` call
+# that WebKit parses once and caches, and messages arriving before the
+# page defines its handler are buffered instead of thrown away.
+_RECV_SCRIPT_SRC = """
+    (function() {
+        if (window.__overai) { return; }
+        const q = [];
+        window.__overai = {
+            recv: function(msg) {
+                const fn = window.receiveMessage;
+                if (typeof fn === 'function') { fn(msg); }
+                else { q.push(msg); }
+            },
+            drain: function() {
+                const fn = window.receiveMessage;
+                if (typeof fn !== 'function') { return; }
+                while (q.length) { fn(q.shift()); }
+            }
+        };
+    })();
+"""
+
+_theme_user_script = None
+_timer_registry_script = None
+_recv_user_script = None
+
+def _get_recv_script():
+    """Shared WKUserScript installing the __overai message receiver."""
+    global _recv_user_script
+    if _recv_user_script is None:
+        _recv_user_script = WKUserScript.alloc().initWithSource_injectionTime_forMainFrameOnly_(
+            _RECV_SCRIPT_SRC,
+            WKUserScriptInjectionTimeAtDocumentStart,
+            True
+        )
+    return _recv_user_script
+
+def _get_timer_registry_script():
+    """Shared WKUserScript installing the timer registry."""
+    global _timer_registry_script
+    if _timer_registry_script is None:
+        _timer_registry_script = WKUserScript.alloc().initWithSource_injectionTime_forMainFrameOnly_(
+            _TIMER_REGISTRY_SCRIPT_SRC,
+            WKUserScriptInjectionTimeAtDocumentStart,
+            True
+        )
+    return _timer_registry_script
+
+def _get_theme_user_script():
+    """Shared WKUserScript for theme reporting.
+
+    WebKit keys its compiled-script cache on the source string, so every
+    webview reusing this one object also reuses the compiled bytecode
+    when the process pool is shared.
+    """
+    global _theme_user_script
+    if _theme_user_script is None:
+        _theme_user_script = WKUserScript.alloc().initWithSource_injectionTime_forMainFrameOnly_(
+            _THEME_SCRIPT_SRC,
+            WKUserScriptInjectionTimeAtDocumentEnd,
+            True  # Only inject into main frame (saves memory)
+        )
+    return _theme_user_script
+
 # Memory cache limits (in bytes)
 MEMORY_CACHE_LIMIT = 10 * 1024 * 1024  # 10 MB
 DISK_CACHE_LIMIT = 50 * 1024 * 1024  # 50 MB
 
-
-@dataclass
-class AIService:
+# How long a fetched Ollama model list stays fresh
+MODELS_CACHE_TTL = 30.0  # seconds
+
+# Content-blocker identifier; WKContentRuleListStore caches the compiled
+# rule list on disk under this key, so compilation is a one-time cost
+BLOCKLIST_IDENTIFIER = "overai-blocklist"
+
+# Third-party ad/analytics hosts the AI services pull in. Blocking them
+# means fewer requests, fewer JS contexts and less WebContent RAM.
+_BLOCKLIST_RULES = json.dumps([
+    {
+        "trigger": {
+            "url-filter": (
+                "https?://([^/]+\\.)?("
+                "google-analytics\\.com|googletagmanager\\.com|"
+                "doubleclick\\.net|connect\\.facebook\\.net|"
+                "hotjar\\.com|scorecardresearch\\.com"
+                ")/.*"
+            ),
+            "load-type": ["third-party"],
+        },
+        "action": {"type": "block"},
+    },
+])
+
+
+class AIService(NamedTuple):
     """AI Service configuration."""
     name: str
     url: str
     icon: str = ""
 
 
-# Supported AI services (web-based)
-AI_SERVICES = {
+# Supported AI services (web-based). Read-only view: the service table
+# is shared across modules and must never be mutated in place.
+AI_SERVICES = MappingProxyType({
     "grok": AIService("Grok", "https://grok.com", "bolt.fill"),
     "chatgpt": AIService("ChatGPT", "https://chat.openai.com", "bubble.left.fill"),
     "claude": AIService("Claude", "https://claude.ai/chat", "quote.bubble.fill"),
     "gemini": AIService("Gemini", "https://gemini.google.com", "sparkles"),
     "deepseek": AIService("DeepSeek", "https://chat.deepseek.com", "magnifyingglass"),
     "perplexity": AIService("Perplexity", "https://www.perplexity.ai", "magnifyingglass.circle"),
-}
+})
 
 
-def get_local_ai_html(models_json: str) -> str:
-    """Generate Local AI HTML with injected models."""
-    # Escape the JSON for safe injection into JavaScript
-    safe_json = models_json.replace('\\', '\\\\').replace("'", "\\'").replace('\n', ' ')
-    
-    return f'''<!DOCTYPE html>
+# The Local AI page template, built once at import time. The only
+# dynamic part is the __MODELS_B64__ placeholder; base64 output is
+# always safe inside a JS string literal, so no escape pass is needed.
+_LOCAL_AI_TEMPLATE = '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Local AI</title>
     <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+        * { margin: 0; padding: 0; box-sizing: border-box; }
         
-        :root {{
+        :root {
             --bg: #000000;
             --bg-secondary: #1c1c1e;
             --bg-input: #1c1c1e;
@@ -86,9 +264,9 @@ def get_local_ai_html(models_json: str) -> str:
             --text-dim: #8e8e93;
             --text-muted: #636366;
             --green: #30d158;
-        }}
+        }
         
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'SF Pro Text', sans-serif;
             background: var(--bg);
             color: var(--text);
@@ -96,25 +274,25 @@ def get_local_ai_html(models_json: str) -> str:
             display: flex;
             flex-direction: column;
             -webkit-font-smoothing: antialiased;
-        }}
+        }
         
         /* Header - minimal like iMessage */
-        .header {{
+        .header {
             background: var(--bg-secondary);
             padding: 14px 16px;
             display: flex;
             align-items: center;
             justify-content: space-between;
             border-bottom: 0.5px solid rgba(255,255,255,0.1);
-        }}
+        }
         
-        .header-left {{
+        .header-left {
             display: flex;
             align-items: center;
             gap: 10px;
-        }}
+        }
         
-        .header-icon {{
+        .header-icon {
             width: 36px;
             height: 36px;
             background: linear-gradient(180deg, #5ac8fa 0%, #007aff 100%);
@@ -122,20 +300,20 @@ def get_local_ai_html(models_json: str) -> str:
             display: flex;
             align-items: center;
             justify-content: center;
-        }}
+        }
         
-        .header-icon svg {{
+        .header-icon svg {
             width: 20px;
             height: 20px;
             fill: white;
-        }}
+        }
         
-        .header-title {{
+        .header-title {
             font-size: 17px;
             font-weight: 600;
-        }}
+        }
         
-        .model-selector {{
+        .model-selector {
             background: rgba(255,255,255,0.08);
             border: 1px solid rgba(255,255,255,0.15);
             border-radius: 16px;
@@ -151,56 +329,56 @@ def get_local_ai_html(models_json: str) -> str:
             background-repeat: no-repeat;
             background-position: right 10px center;
             transition: all 0.15s ease;
-        }}
+        }
         
-        .model-selector:hover {{
+        .model-selector:hover {
             background: rgba(255,255,255,0.12);
             border-color: rgba(255,255,255,0.25);
-        }}
+        }
         
-        .model-selector:focus {{
+        .model-selector:focus {
             outline: none;
             border-color: var(--blue);
             box-shadow: 0 0 0 3px rgba(11, 132, 254, 0.2);
-        }}
+        }
         
-        .model-selector option {{
+        .model-selector option {
             background: #2c2c2e;
             color: white;
             padding: 10px;
-        }}
+        }
         
-        .status-badge {{
+        .status-badge {
             display: flex;
             align-items: center;
             gap: 5px;
             font-size: 12px;
             color: var(--text-dim);
-        }}
+        }
         
-        .status-dot {{
+        .status-dot {
             width: 6px;
             height: 6px;
             border-radius: 50%;
             background: var(--text-muted);
-        }}
+        }
         
-        .status-dot.online {{ background: var(--green); }}
+        .status-dot.online { background: var(--green); }
         
         /* Messages area */
-        .messages {{
+        .messages {
             flex: 1;
             overflow-y: auto;
             padding: 16px;
             display: flex;
             flex-direction: column;
             gap: 2px;
-        }}
+        }
         
-        .messages::-webkit-scrollbar {{ width: 0; }}
+        .messages::-webkit-scrollbar { width: 0; }
         
         /* Welcome state */
-        .welcome {{
+        .welcome {
             flex: 1;
             display: flex;
             flex-direction: column;
@@ -208,9 +386,9 @@ def get_local_ai_html(models_json: str) -> str:
             justify-content: center;
             text-align: center;
             gap: 16px;
-        }}
+        }
         
-        .welcome-icon {{
+        .welcome-icon {
             width: 80px;
             height: 80px;
             background: linear-gradient(180deg, #5ac8fa 0%, #007aff 100%);
@@ -218,93 +396,93 @@ def get_local_ai_html(models_json: str) -> str:
             display: flex;
             align-items: center;
             justify-content: center;
-        }}
+        }
         
-        .welcome-icon svg {{
+        .welcome-icon svg {
             width: 40px;
             height: 40px;
             fill: white;
-        }}
+        }
         
-        .welcome h1 {{
+        .welcome h1 {
             font-size: 28px;
             font-weight: 700;
-        }}
+        }
         
-        .welcome p {{
+        .welcome p {
             color: var(--text-dim);
             font-size: 15px;
             max-width: 280px;
-        }}
+        }
         
         /* Message bubbles - iMessage style */
-        .message {{
+        .message {
             display: flex;
             flex-direction: column;
             max-width: 70%;
             animation: slideIn 0.2s ease;
-        }}
+        }
         
-        @keyframes slideIn {{
-            from {{ opacity: 0; transform: translateY(10px); }}
-            to {{ opacity: 1; transform: translateY(0); }}
-        }}
+        @keyframes slideIn {
+            from { opacity: 0; transform: translateY(10px); }
+            to { opacity: 1; transform: translateY(0); }
+        }
         
-        .message.sent {{
+        .message.sent {
             align-self: flex-end;
-        }}
+        }
         
-        .message.received {{
+        .message.received {
             align-self: flex-start;
-        }}
+        }
         
-        .bubble {{
+        .bubble {
             padding: 10px 14px;
             font-size: 16px;
             line-height: 1.35;
             word-wrap: break-word;
-        }}
+        }
         
         /* Sent messages - blue bubbles */
-        .message.sent .bubble {{
+        .message.sent .bubble {
             background: var(--blue);
             color: white;
             border-radius: 18px 18px 4px 18px;
-        }}
+        }
         
-        .message.sent.first .bubble {{
+        .message.sent.first .bubble {
             border-radius: 18px 18px 4px 18px;
-        }}
+        }
         
-        .message.sent.last .bubble {{
+        .message.sent.last .bubble {
             border-radius: 18px 4px 18px 18px;
-        }}
+        }
         
-        .message.sent.single .bubble {{
+        .message.sent.single .bubble {
             border-radius: 18px;
-        }}
+        }
         
         /* Received messages - gray bubbles */
-        .message.received .bubble {{
+        .message.received .bubble {
             background: var(--gray);
             color: white;
             border-radius: 18px 18px 18px 4px;
-        }}
+        }
         
-        .message.received.first .bubble {{
+        .message.received.first .bubble {
             border-radius: 18px 18px 18px 4px;
-        }}
+        }
         
-        .message.received.last .bubble {{
+        .message.received.last .bubble {
             border-radius: 4px 18px 18px 18px;
-        }}
+        }
         
-        .message.received.single .bubble {{
+        .message.received.single .bubble {
             border-radius: 18px;
-        }}
+        }
         
         /* Code styling */
-        .bubble pre {{
+        .bubble pre {
             background: rgba(0,0,0,0.3);
             padding: 10px;
             border-radius: 8px;
@@ -312,62 +490,62 @@ def get_local_ai_html(models_json: str) -> str:
             margin: 6px 0;
             font-size: 13px;
             font-family: 'SF Mono', Menlo, monospace;
-        }}
+        }
         
-        .bubble code {{
+        .bubble code {
             background: rgba(0,0,0,0.2);
             padding: 2px 4px;
             border-radius: 4px;
             font-size: 14px;
             font-family: 'SF Mono', Menlo, monospace;
-        }}
+        }
         
-        .bubble strong {{
+        .bubble strong {
             font-weight: 600;
-        }}
+        }
         
-        .bubble h3, .bubble h4 {{
+        .bubble h3, .bubble h4 {
             font-size: 15px;
             font-weight: 600;
             margin: 8px 0 4px 0;
-        }}
+        }
         
-        .bubble li {{
+        .bubble li {
             margin-left: 16px;
-        }}
+        }
         
         /* Typing indicator */
-        .typing {{
+        .typing {
             display: flex;
             align-items: center;
             gap: 4px;
             padding: 12px 16px;
-        }}
+        }
         
-        .typing span {{
+        .typing span {
             width: 8px;
             height: 8px;
             background: var(--text-dim);
             border-radius: 50%;
             animation: typing 1.4s infinite ease-in-out;
-        }}
+        }
         
-        .typing span:nth-child(1) {{ animation-delay: 0s; }}
-        .typing span:nth-child(2) {{ animation-delay: 0.2s; }}
-        .typing span:nth-child(3) {{ animation-delay: 0.4s; }}
+        .typing span:nth-child(1) { animation-delay: 0s; }
+        .typing span:nth-child(2) { animation-delay: 0.2s; }
+        .typing span:nth-child(3) { animation-delay: 0.4s; }
         
-        @keyframes typing {{
-            0%, 60%, 100% {{ opacity: 0.3; transform: scale(0.8); }}
-            30% {{ opacity: 1; transform: scale(1); }}
-        }}
+        @keyframes typing {
+            0%, 60%, 100% { opacity: 0.3; transform: scale(0.8); }
+            30% { opacity: 1; transform: scale(1); }
+        }
         
         /* Input area - iMessage style */
-        .input-area {{
+        .input-area {
             padding: 8px 12px 24px;
             background: var(--bg);
-        }}
+        }
         
-        .input-container {{
+        .input-container {
             display: flex;
             align-items: flex-end;
             gap: 8px;
@@ -375,13 +553,13 @@ def get_local_ai_html(models_json: str) -> str:
             border-radius: 20px;
             padding: 4px 4px 4px 14px;
             border: 1px solid rgba(255,255,255,0.1);
-        }}
+        }
         
-        .input-container:focus-within {{
+        .input-container:focus-within {
             border-color: var(--blue);
-        }}
+        }
         
-        textarea {{
+        textarea {
             flex: 1;
             background: transparent;
             border: none;
@@ -393,13 +571,13 @@ def get_local_ai_html(models_json: str) -> str:
             font-family: inherit;
             line-height: 1.3;
             max-height: 100px;
-        }}
+        }
         
-        textarea::placeholder {{
+        textarea::placeholder {
             color: var(--text-muted);
-        }}
+        }
         
-        .send-btn {{
+        .send-btn {
             width: 32px;
             height: 32px;
             background: var(--blue);
@@ -411,25 +589,25 @@ def get_local_ai_html(models_json: str) -> str:
             justify-content: center;
             transition: all 0.15s ease;
             flex-shrink: 0;
-        }}
+        }
         
-        .send-btn svg {{
+        .send-btn svg {
             width: 16px;
             height: 16px;
             fill: white;
             margin-left: 2px;
-        }}
+        }
         
-        .send-btn:hover {{
+        .send-btn:hover {
             transform: scale(1.05);
-        }}
+        }
         
-        .send-btn:disabled {{
+        .send-btn:disabled {
             background: var(--gray);
             opacity: 0.5;
             cursor: not-allowed;
             transform: none;
-        }}
+        }
     </style>
 </head>
 <body>
@@ -465,36 +643,36 @@ def get_local_ai_html(models_json: str) -> str:
     </div>
 </div>
 <script>
-(function() {{
+(function() {
     'use strict';
     
     // Injected models data
-    const MODELS = JSON.parse('{safe_json}');
+    const MODELS = JSON.parse(atob('__MODELS_B64__'));
     const MAX_MESSAGES = 20; // Limit chat history for memory
     
     let currentModel = '';
     let msgs = [];
     let busy = false;
     
-    function getEl(id) {{ return document.getElementById(id); }}
+    function getEl(id) { return document.getElementById(id); }
     
     // Trim old messages to limit memory usage
-    function trimMessages() {{
-        if (msgs.length > MAX_MESSAGES) {{
+    function trimMessages() {
+        if (msgs.length > MAX_MESSAGES) {
             msgs = msgs.slice(-MAX_MESSAGES);
             // Also trim DOM elements
             const messagesArea = getEl('messages');
-            if (messagesArea) {{
+            if (messagesArea) {
                 const msgDivs = messagesArea.querySelectorAll('.message');
                 const excess = msgDivs.length - MAX_MESSAGES;
-                for (let i = 0; i < excess; i++) {{
+                for (let i = 0; i < excess; i++) {
                     msgDivs[i].remove();
-                }}
-            }}
-        }}
-    }}
+                }
+            }
+        }
+    }
     
-    function init() {{
+    function init() {
         console.log('Local AI init started, models:', MODELS.length);
         
         const modelSelect = getEl('modelSelect');
@@ -506,27 +684,27 @@ def get_local_ai_html(models_json: str) -> str:
         const messagesArea = getEl('messages');
         const welcome = getEl('welcome');
         
-        if (!modelSelect || !messagesArea) {{
+        if (!modelSelect || !messagesArea) {
             console.error('DOM not ready, retrying...');
             setTimeout(init, 100);
             return;
-        }}
+        }
         
-        if (MODELS.length === 0) {{
+        if (MODELS.length === 0) {
             if (statusText) statusText.textContent = 'Offline';
             if (statusDot) statusDot.className = 'status-dot';
             if (welcomeText) welcomeText.textContent = 'No models found. Make sure Ollama is running.';
             return;
-        }}
+        }
         
         // Populate models
         modelSelect.innerHTML = '';
-        MODELS.forEach(function(m) {{
+        MODELS.forEach(function(m) {
             const opt = document.createElement('option');
             opt.value = m.name;
             opt.textContent = m.name.split(':')[0];
             modelSelect.appendChild(opt);
-        }});
+        });
         
         currentModel = MODELS[0].name;
         modelSelect.disabled = false;
@@ -536,9 +714,9 @@ def get_local_ai_html(models_json: str) -> str:
         statusText.textContent = 'Connected';
         
         // Update welcome message
-        if (welcomeText) {{
+        if (welcomeText) {
             welcomeText.textContent = 'Type a message to start chatting with ' + currentModel.split(':')[0];
-        }}
+        }
         
         // Enable input
         userInput.disabled = false;
@@ -546,7 +724,7 @@ def get_local_ai_html(models_json: str) -> str:
         sendBtn.disabled = false;
         
         // *** ATTACH EVENT HANDLERS HERE - AFTER DOM IS READY ***
-        modelSelect.onchange = function() {{
+        modelSelect.onchange = function() {
             currentModel = modelSelect.value;
             msgs = [];
             // Clear messages and show welcome
@@ -554,9 +732,9 @@ def get_local_ai_html(models_json: str) -> str:
             if (welcomeText) welcomeText.textContent = 'Type a message to start chatting with ' + currentModel.split(':')[0];
             // Remove all message bubbles
             messagesArea.querySelectorAll('.message').forEach(m => m.remove());
-        }};
+        };
         
-        sendBtn.onclick = function() {{
+        sendBtn.onclick = function() {
             const text = userInput.value.trim();
             if (!text || busy || !currentModel) return;
             
@@ -569,7 +747,7 @@ def get_local_ai_html(models_json: str) -> str:
             userDiv.innerHTML = '<div class="bubble">' + text.replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/>/g, '&gt;') + '</div>';
             messagesArea.appendChild(userDiv);
             
-            msgs.push({{ role: 'user', content: text }});
+            msgs.push({ role: 'user', content: text });
             trimMessages();
             userInput.value = '';
             busy = true;
@@ -583,43 +761,45 @@ def get_local_ai_html(models_json: str) -> str:
             messagesArea.scrollTop = messagesArea.scrollHeight;
             
             // Send to Python via webkit message handler
-            if (window.webkit && window.webkit.messageHandlers && window.webkit.messageHandlers.ollama) {{
-                window.webkit.messageHandlers.ollama.postMessage({{
+            if (window.webkit && window.webkit.messageHandlers && window.webkit.messageHandlers.ollama) {
+                window.webkit.messageHandlers.ollama.postMessage({
                     type: 'chat',
                     model: currentModel,
                     messages: msgs
-                }});
-            }} else {{
+                });
+            } else {
                 getEl('currentBubble').innerHTML = 'Error: Message handler not available';
                 busy = false;
                 sendBtn.disabled = false;
-            }}
-        }};
+            }
+        };
         
-        userInput.onkeydown = function(e) {{
-            if (e.key === 'Enter' && !e.shiftKey) {{
+        userInput.onkeydown = function(e) {
+            if (e.key === 'Enter' && !e.shiftKey) {
                 e.preventDefault();
                 sendBtn.onclick();
-            }}
-        }};
+            }
+        };
         
-        userInput.oninput = function() {{
+        userInput.oninput = function() {
             this.style.height = 'auto';
             this.style.height = Math.min(this.scrollHeight, 150) + 'px';
-        }};
+        };
         
         userInput.focus();
         console.log('Local AI init complete');
-    }}
+    }
     
-    // Response handler from Python (must be global)
-    window.receiveResponse = function(response) {{
+    // Response handler from Python (must be global). Also the error
+    // path after a partial stream, so discard any buffered chunks.
+    window.receiveResponse = function(response) {
+        streamText = '';
         const bubble = document.getElementById('currentBubble');
         const sendBtn = getEl('sendBtn');
         const userInput = getEl('userInput');
         const chatArea = getEl('chatArea');
         
-        if (bubble) {{
+        if (bubble) {
             bubble.removeAttribute('id');
             // Enhanced markdown formatting
             let formatted = response
@@ -643,26 +823,54 @@ def get_local_ai_html(models_json: str) -> str:
                 // Line breaks
                 .replace(/\\n/g, '<br>');
             bubble.innerHTML = formatted;
-            msgs.push({{ role: 'assistant', content: response }});
-        }}
+            msgs.push({ role: 'assistant', content: response });
+        }
         busy = false;
         if (sendBtn) sendBtn.disabled = false;
         if (userInput) userInput.focus();
         if (chatArea) chatArea.scrollTop = chatArea.scrollHeight;
-    }};
-    
+    };
+
+    // Streaming handlers: the fallback page shows chunks as plain text
+    // and runs the full markdown pass once at the end via receiveResponse
+    let streamText = '';
+    window.receiveResponseChunk = function(chunk) {
+        streamText += chunk;
+        const bubble = document.getElementById('currentBubble');
+        if (bubble) bubble.textContent = streamText;
+        const chatArea = getEl('chatArea');
+        if (chatArea) chatArea.scrollTop = chatArea.scrollHeight;
+    };
+    window.receiveResponseDone = function() {
+        const text = streamText;
+        streamText = '';
+        window.receiveResponse(text);
+    };
+
     // Start init when DOM is ready
-    if (document.readyState === 'loading') {{
+    if (document.readyState === 'loading') {
         document.addEventListener('DOMContentLoaded', init);
-    }} else {{
+    } else {
         init();
-    }}
-}})();
+    }
+})();
 </script>
 </body>
 </html>'''
 
 
+@lru_cache(maxsize=4)
+def get_local_ai_html(models_json: str) -> str:
+    """Generate Local AI HTML with injected models.
+
+    models_json is canonical JSON from json.dumps, so it doubles as the
+    cache key; repeated loads with an unchanged model list reuse the
+    already-built page.
+    """
+    b64 = base64.b64encode(models_json.encode()).decode('ascii')
+    return _LOCAL_AI_TEMPLATE.replace('__MODELS_B64__', b64)
+
+
 class WebViewManager(NSObject):
     """
     Manages WKWebView with lazy loading and aggressive memory optimization.
@@ -676,6 +884,7 @@ class WebViewManager(NSObject):
 
         self._web_view: Optional[WKWebView] = None
         self._configuration: Optional[WKWebViewConfiguration] = None
+        self._theme_script = None
         self._current_service: str = "grok"
         self._theme_manager = ThemeManager()
         self._background_callback: Optional[Callable] = None
@@ -688,32 +897,139 @@ class WebViewManager(NSObject):
         # API service handling
         self._current_api_service = None
 
+        # Pooled HTTP client (lazy) and the Ollama client singleton,
+        # bound once instead of re-resolved per message
+        self._http = None
+        self._ollama_client = None
+
+        # (timestamp, models_json) cache for the Ollama model list
+        self._models_cache = None
+
+        # Shared pool for network work: reusing two long-lived threads
+        # instead of spawning one per request (thread creation + ~8MB
+        # stack each) keeps rapid-fire sends cheap
+        self._executor = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="overai-net"
+        )
+
+        # Service URLs are immutable, so build each NSURLRequest once
+        self._request_cache = {}
+
+        # Whether the Local AI models user script is currently installed;
+        # it must not ride along into third-party pages
+        self._models_script_installed = False
+
+        # Theme callback debounce state: identical colors are dropped
+        # and bursts collapse into at most one callback per 50ms
+        self._last_bg_color = None
+        self._bg_flush_scheduled = False
+
+        # Batched JS queue: snippets are coalesced into one
+        # evaluateJavaScript round-trip per flush window. The lock
+        # matters because Ollama worker threads enqueue from background
+        # threads.
+        self._js_queue = []
+        self._js_flush_scheduled = False
+        self._js_lock = threading.Lock()
+
         # Load saved service
         self._load_service()
 
         # Setup memory pressure monitoring
         self._setup_memory_pressure_handler()
 
+        # Spin up the WebContent process now so the first real
+        # navigation doesn't pay process launch + JIT warm-up
+        self._warm_webview = None
+        self._prewarm_web_process()
+
         return self
 
+    def _prewarm_web_process(self):
+        """Pre-warm the shared process pool with a throwaway webview.
+
+        A hidden 1x1 webview loading an empty page forces the WebContent
+        process to launch during app init; the first service load then
+        reuses the hot process via the shared pool. The webview is
+        discarded after the first real navigation.
+        """
+        try:
+            config = WKWebViewConfiguration.alloc().init()
+            config.setProcessPool_(get_shared_process_pool())
+            config.setWebsiteDataStore_(WKWebsiteDataStore.defaultDataStore())
+            self._warm_webview = WKWebView.alloc().initWithFrame_configuration_(
+                NSMakeRect(0, 0, 1, 1), config
+            )
+            self._warm_webview.loadHTMLString_baseURL_("<html></html>", None)
+            logger.debug("Pre-warmed WebContent process")
+        except Exception as e:
+            logger.debug(f"Could not pre-warm web process: {e}")
+
+    def _discard_warm_webview(self):
+        """Release the pre-warm webview once a real navigation happened."""
+        if self._warm_webview is not None:
+            self._warm_webview = None
+            logger.debug("Discarded pre-warm webview")
+
     def _setup_memory_pressure_handler(self):
-        """Subscribe to system memory pressure notifications."""
+        """Subscribe to system memory pressure events.
+
+        The old NSNotificationCenter registration listened for
+        NSProcessInfoPowerStateDidChangeNotification, which fires on
+        power-state changes, never on memory pressure. The dispatch
+        source is the real signal and fires before jetsam gets angry.
+        """
+        if libdispatch is None:
+            logger.debug("libdispatch not available; memory pressure handler off")
+            return
         try:
-            # Register for memory warning notifications
-            NSNotificationCenter.defaultCenter().addObserver_selector_name_object_(
-                self,
-                "handleMemoryPressure:",
-                "NSProcessInfoPowerStateDidChangeNotification",
-                None
+            source = libdispatch.dispatch_source_create(
+                libdispatch.DISPATCH_SOURCE_TYPE_MEMORYPRESSURE,
+                0,
+                libdispatch.DISPATCH_MEMORYPRESSURE_WARN
+                | libdispatch.DISPATCH_MEMORYPRESSURE_CRITICAL,
+                libdispatch.dispatch_get_global_queue(0, 0),
             )
-            logger.debug("Memory pressure handler registered")
+            # Keep a reference or the source is collected and cancelled
+            self._memory_pressure_observer = source
+            libdispatch.dispatch_source_set_event_handler(
+                source, self._handle_memory_pressure_event
+            )
+            libdispatch.dispatch_resume(source)
+            logger.debug("Memory pressure dispatch source registered")
         except Exception as e:
             logger.debug(f"Could not register memory pressure handler: {e}")
 
-    def handleMemoryPressure_(self, notification):
-        """Handle system memory pressure by clearing caches."""
-        logger.info("Memory pressure detected - clearing caches")
+    def _handle_memory_pressure_event(self):
+        """Handle a memory pressure event (runs on a dispatch queue).
+
+        Responds in tiers: a warning clears caches only, while critical
+        pressure also suspends the webview (resume() reloads it when the
+        overlay is next shown).
+        """
+        pressure = 0
+        try:
+            pressure = libdispatch.dispatch_source_get_data(
+                self._memory_pressure_observer
+            )
+        except Exception:
+            pass
+        if pressure & libdispatch.DISPATCH_MEMORYPRESSURE_CRITICAL:
+            logger.info("Critical memory pressure - suspending WebView")
+            AppHelper.callAfter(self._handle_critical_pressure)
+        else:
+            logger.info("Memory pressure warning - clearing caches")
+            AppHelper.callAfter(self._clear_memory_caches)
+
+    def _handle_critical_pressure(self):
+        """Shed as much memory as possible (main thread)."""
         self._clear_memory_caches()
+        # suspend() blanks the DOM and only show_window resumes, so it
+        # is safe solely while the overlay is hidden; with the page on
+        # screen, cache shedding has to suffice
+        window = self._web_view.window() if self._web_view else None
+        if window is None or not window.isVisible():
+            self.suspend()
 
     def _clear_memory_caches(self):
         """Clear in-memory caches to reduce RAM usage."""
@@ -728,25 +1044,29 @@ class WebViewManager(NSObject):
         except Exception as e:
             logger.error(f"Failed to clear caches: {e}")
 
-    def _clear_back_forward_list(self):
-        """Clear navigation history to free memory (10-30 MB savings)."""
+    def _clear_back_forward_list(self, allow_navigation=False):
+        """Clear navigation history to free memory (10-30 MB savings).
+
+        WKBackForwardList has no public clearing API; the private
+        _removeAllItems selector does it in place, so use it when the
+        class responds. The about:blank fallback replaces the live page,
+        so it is only taken when the caller is about to issue a real
+        load (allow_navigation=True); on the cache-clearing path the
+        history is left alone rather than blanking the page.
+        """
         if not self._web_view:
             return
         try:
-            # Load empty page to clear back-forward list
-            # This is the most reliable way to clear navigation history
-            self._web_view.evaluateJavaScript_completionHandler_(
-                """
-                (function() {
-                    // Clear any references that might hold memory
-                    if (window.history && window.history.length > 1) {
-                        // Can't directly clear, but we can minimize impact
-                        return window.history.length;
-                    }
-                    return 0;
-                })();
-                """,
-                lambda result, error: None
+            bfl = self._web_view.backForwardList()
+            if bfl.respondsToSelector_("_removeAllItems"):
+                bfl.performSelector_("_removeAllItems")
+                return
+            if not allow_navigation:
+                return
+            # Public fallback: navigate away so WebKit releases the
+            # snapshot cache for the history entries
+            self._web_view.loadRequest_(
+                NSURLRequest.requestWithURL_(NSURL.URLWithString_("about:blank"))
             )
         except Exception as e:
             logger.debug(f"Could not clear back-forward list: {e}")
@@ -755,8 +1075,8 @@ class WebViewManager(NSObject):
         """Load saved service preference."""
         try:
             if self.CONFIG_PATH.exists():
-                with open(self.CONFIG_PATH, 'r') as f:
-                    data = json.load(f)
+                # One read() syscall + one C-level parse
+                data = _json_loads(self.CONFIG_PATH.read_bytes())
                 self._current_service = data.get('service', 'grok')
                 # Allow local_ai as a valid service
                 if self._current_service not in AI_SERVICES and self._current_service != 'local_ai':
@@ -769,8 +1089,11 @@ class WebViewManager(NSObject):
         self._current_service = service_id
         try:
             self.CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.CONFIG_PATH, 'w') as f:
-                json.dump({'service': service_id}, f)
+            # Write-then-rename keeps the config atomic: a crash mid-save
+            # leaves the old file intact instead of a truncated one
+            tmp_path = self.CONFIG_PATH.with_suffix('.json.tmp')
+            tmp_path.write_bytes(_json_dumps_bytes({'service': service_id}))
+            os.replace(tmp_path, self.CONFIG_PATH)
         except Exception as e:
             logger.error(f"Failed to save service: {e}")
 
@@ -788,6 +1111,17 @@ class WebViewManager(NSObject):
         prefs = WKPreferences.alloc().init()
         prefs.setJavaScriptCanOpenWindowsAutomatically_(False)  # Reduce memory
         prefs.setJavaScriptEnabled_(True)  # Keep JS enabled for AI services
+        # Trim optional machinery the overlay never uses; each of these
+        # keys may not exist on older WebKit, hence the guarded KVC sets
+        for key, value in (
+            ("developerExtrasEnabled", False),
+            ("elementFullscreenEnabled", False),
+            ("fullScreenEnabled", False),
+        ):
+            try:
+                prefs.setValue_forKey_(value, key)
+            except Exception:
+                pass
         config.setPreferences_(prefs)
 
         # Use shared process pool for memory efficiency
@@ -824,6 +1158,9 @@ class WebViewManager(NSObject):
         # Setup message handler for background color
         self._setup_message_handler(config)
 
+        # Block third-party ad/analytics loads on the AI service pages
+        self._install_content_blocker(config)
+
         # Load initial service
         if self._current_service == 'local_ai':
             self.load_local_ai()
@@ -845,6 +1182,41 @@ class WebViewManager(NSObject):
         except Exception as e:
             logger.error(f"Failed to setup limited cache: {e}")
 
+    def _install_content_blocker(self, config: WKWebViewConfiguration):
+        """Attach the compiled ad/analytics blocklist to the configuration.
+
+        The store keeps the compiled list on disk keyed by identifier, so
+        after the first launch this is a lookup, not a recompile. Both
+        paths complete asynchronously; a failure just means no blocking.
+        """
+        controller = config.userContentController()
+
+        def add_list(rule_list, error):
+            if rule_list is not None:
+                controller.addContentRuleList_(rule_list)
+                logger.debug("Content blocklist installed")
+
+        def compiled(rule_list, error):
+            if error is not None:
+                logger.debug(f"Content blocklist compile failed: {error}")
+            add_list(rule_list, error)
+
+        def looked_up(rule_list, error):
+            if rule_list is not None:
+                add_list(rule_list, None)
+                return
+            store.compileContentRuleListForIdentifier_encodedContentRuleList_completionHandler_(
+                BLOCKLIST_IDENTIFIER, _BLOCKLIST_RULES, compiled
+            )
+
+        try:
+            store = WKContentRuleListStore.defaultStore()
+            store.lookUpContentRuleListForIdentifier_completionHandler_(
+                BLOCKLIST_IDENTIFIER, looked_up
+            )
+        except Exception as e:
+            logger.debug(f"Content blocker unavailable: {e}")
+
     def _setup_message_handler(self, config: WKWebViewConfiguration):
         """Setup JavaScript message handlers for theme detection and Ollama."""
         controller = config.userContentController()
@@ -855,46 +1227,52 @@ class WebViewManager(NSObject):
         # Ollama handler for Local AI
         controller.addScriptMessageHandler_name_(self, "ollama")
 
-        # Minimal script - only runs once on load, no continuous observers
-        # Saves significant RAM by avoiding MutationObserver overhead
-        script = """
-            (function() {
-                function reportTheme() {
-                    const body = document.body;
-                    if (body) {
-                        const bg = window.getComputedStyle(body).backgroundColor;
-                        if (window.webkit && window.webkit.messageHandlers && window.webkit.messageHandlers.themeHandler) {
-                            window.webkit.messageHandlers.themeHandler.postMessage(bg);
-                        }
-                    }
-                }
-                // Report once on load only
-                if (document.readyState === 'loading') {
-                    document.addEventListener('DOMContentLoaded', reportTheme, {once: true});
-                } else {
-                    reportTheme();
-                }
-            })();
+        # Shared theme-reporter script (one compiled copy across webviews)
+        self._theme_script = _get_theme_user_script()
+        controller.addUserScript_(self._theme_script)
+
+        # Timer registry so suspend() can clear live timers in O(live)
+        controller.addUserScript_(_get_timer_registry_script())
+
+        # Persistent receiver for native->page message pushes
+        controller.addUserScript_(_get_recv_script())
+
+    def _install_user_scripts(self, models_json=None):
+        """Reinstall user scripts, optionally injecting the model list.
+
+        The Local AI page is a static bundled file; the only dynamic data
+        (the Ollama model list) is handed to it as window.MODELS at
+        document start.
         """
-        user_script = WKUserScript.alloc().initWithSource_injectionTime_forMainFrameOnly_(
-            script,
-            WKUserScriptInjectionTimeAtDocumentEnd,
-            True  # Only inject into main frame (saves memory)
-        )
-        controller.addUserScript_(user_script)
+        if not self._web_view:
+            return
+        controller = self._web_view.configuration().userContentController()
+        controller.removeAllUserScripts()
+        controller.addUserScript_(self._theme_script)
+        controller.addUserScript_(_get_timer_registry_script())
+        controller.addUserScript_(_get_recv_script())
+        if models_json is not None:
+            # models_json is canonical JSON, valid as a JS literal
+            models_script = WKUserScript.alloc().initWithSource_injectionTime_forMainFrameOnly_(
+                f"window.MODELS = {models_json};",
+                WKUserScriptInjectionTimeAtDocumentStart,
+                True
+            )
+            controller.addUserScript_(models_script)
+        self._models_script_installed = models_json is not None
 
     def load_service(self, service_id: str):
         """Load AI service."""
-        if service_id not in AI_SERVICES:
+        service = AI_SERVICES.get(service_id)
+        if service is None:
             logger.error(f"Unknown service: {service_id}")
             return
-
-        service = AI_SERVICES[service_id]
         logger.info(f"Loading service: {service.name}")
 
-        # Clear back-forward list when switching services to prevent memory accumulation
+        # Clear back-forward list when switching services to prevent memory
+        # accumulation; the real load below makes the navigation fallback safe
         if self._last_loaded_service and self._last_loaded_service != service_id:
-            self._clear_back_forward_list()
+            self._clear_back_forward_list(allow_navigation=True)
 
         self._current_service = service_id
         self._last_loaded_service = service_id
@@ -902,12 +1280,25 @@ class WebViewManager(NSObject):
         self.save_service(service_id)
 
         if self._web_view:
-            url = NSURL.URLWithString_(service.url)
-            request = NSURLRequest.requestWithURL_(url)
+            # Don't inject the local model list into third-party pages
+            if self._models_script_installed:
+                self._install_user_scripts(None)
+            request = self._request_cache.get(service_id)
+            if request is None:
+                request = NSURLRequest.requestWithURL_(
+                    NSURL.URLWithString_(service.url)
+                )
+                self._request_cache[service_id] = request
             self._web_view.loadRequest_(request)
+            self._discard_warm_webview()
 
     def load_local_ai(self):
-        """Load the Local AI (Ollama) chat interface using data URI."""
+        """Load the Local AI (Ollama) chat interface.
+
+        The Ollama model fetch is a blocking HTTP call, so it runs on a
+        background thread; the page itself is loaded back on the main
+        thread once the model list is in hand.
+        """
         logger.info("Loading Local AI chat interface")
         self._current_service = "local_ai"
         self._last_loaded_service = "local_ai"
@@ -917,33 +1308,44 @@ class WebViewManager(NSObject):
         if not self._web_view:
             return
 
-        # Fetch models from Ollama
-        try:
-            from ..api.ollama_client import get_ollama_client
-            client = get_ollama_client()
-            models = client.get_models()
-            models_list = [{'name': m.name} for m in models]
-            models_json = json.dumps(models_list)
-            logger.info(f"Found {len(models)} Ollama models")
-        except Exception as e:
-            logger.error(f"Failed to get Ollama models: {e}")
-            models_json = "[]"
+        def fetch_models():
+            try:
+                models_json = self._get_models_json()
+            except Exception as e:
+                logger.error(f"Failed to get Ollama models: {e}")
+                models_json = "[]"
+            AppHelper.callAfter(self._load_local_ai_page, models_json)
 
-        # Generate HTML with models injected
-        html_content = get_local_ai_html(models_json)
+        self._executor.submit(fetch_models)
 
-        # Write to temp file and load via file:// URL
-        # This is the most reliable method - bypasses all WKWebView sandbox restrictions
-        import tempfile
-        temp_dir = Path(tempfile.gettempdir()) / "overai"
-        temp_dir.mkdir(exist_ok=True)
-        temp_file = temp_dir / "local_ai.html"
-        temp_file.write_text(html_content, encoding='utf-8')
-        
-        file_url = NSURL.fileURLWithPath_(str(temp_file))
-        request = NSURLRequest.requestWithURL_(file_url)
-        self._web_view.loadRequest_(request)
-        logger.info(f"Loaded Local AI from {temp_file}")
+    def _load_local_ai_page(self, models_json):
+        """Load the Local AI page with the given model list (main thread)."""
+        if not self._web_view or self._current_service != "local_ai":
+            return
+
+        index_file = _LOCAL_AI_RESOURCES / "index.html"
+        if index_file.exists():
+            # Load the bundled static page; the model list rides in via
+            # a document-start user script
+            self._install_user_scripts(models_json)
+            self._web_view.loadFileURL_allowingReadAccessToURL_(
+                NSURL.fileURLWithPath_(str(index_file)),
+                NSURL.fileURLWithPath_(str(_LOCAL_AI_RESOURCES))
+            )
+            logger.info(f"Loaded Local AI from {index_file}")
+            self._discard_warm_webview()
+            return
+
+        # Fallback: generate the inline page and hand the string straight
+        # to WebKit — no temp-file write + file:// reload round-trip.
+        # get_local_ai_html is memoized, so an unchanged model list reuses
+        # the already-built page string.
+        html_content = get_local_ai_html(models_json)
+        self._web_view.loadHTMLString_baseURL_(
+            html_content, NSURL.fileURLWithPath_("/")
+        )
+        logger.info("Loaded Local AI from inline template")
+        self._discard_warm_webview()
 
     def reload(self):
         """Reload current page."""
@@ -971,7 +1373,7 @@ class WebViewManager(NSObject):
     def focus_input(self):
         """Focus the text input area."""
         if self._web_view:
-            self._web_view.evaluateJavaScript_completionHandler_(
+            self._enqueue_js(
                 """
                 (function() {
                     const selectors = [
@@ -988,17 +1390,22 @@ class WebViewManager(NSObject):
                         }
                     }
                     return false;
-                })();
-                """,
-                lambda result, error: None
+                })()
+                """
             )
 
     def userContentController_didReceiveScriptMessage_(self, controller, message):
         """Handle messages from JavaScript."""
         if message.name() == "themeHandler":
             bg_color = message.body()
-            if self._background_callback:
-                self._background_callback(bg_color)
+            # Pages can post color updates on scroll/animation frames;
+            # drop repeats and coalesce bursts to ~20 Hz
+            if bg_color == self._last_bg_color:
+                return
+            self._last_bg_color = bg_color
+            if not self._bg_flush_scheduled:
+                self._bg_flush_scheduled = True
+                AppHelper.callLater(0.05, self._flush_bg)
         elif message.name() == "ollama":
             # Handle Ollama messages from Local AI interface
             self._handle_ollama_message(message.body())
@@ -1006,27 +1413,70 @@ class WebViewManager(NSObject):
             # Handle API chat messages
             self._handle_api_chat_message(message.body())
 
+    def _get_http(self):
+        """Pooled HTTP client with keep-alive, or None without httpx."""
+        if httpx is None:
+            return None
+        if self._http is None:
+            self._http = httpx.Client(
+                limits=httpx.Limits(
+                    max_keepalive_connections=8, keepalive_expiry=30
+                ),
+                timeout=httpx.Timeout(60.0, connect=10.0),
+            )
+        return self._http
+
+    def _get_ollama(self):
+        """The Ollama client singleton, bound on first use."""
+        if self._ollama_client is None:
+            self._ollama_client = get_ollama_client()
+        return self._ollama_client
+
+    def _get_models_json(self):
+        """Ollama model list as JSON, cached for MODELS_CACHE_TTL.
+
+        Opening the Local AI page and the page's own getModels request
+        both land here; within the TTL only the first pays the HTTP
+        round-trip. Fetch errors propagate and are never cached.
+        """
+        now = time.monotonic()
+        if self._models_cache is not None:
+            ts, cached = self._models_cache
+            if now - ts < MODELS_CACHE_TTL:
+                return cached
+        client = self._get_ollama()
+        models = client.get_models()
+        models_json = _json_dumps([{'name': m.name} for m in models])
+        logger.info(f"Found {len(models)} Ollama models")
+        self._models_cache = (now, models_json)
+        return models_json
+
+    def invalidate_models_cache(self):
+        """Force the next model-list request to refetch (refresh action)."""
+        self._models_cache = None
+
+    def _flush_bg(self):
+        """Deliver the most recent background color to the callback."""
+        self._bg_flush_scheduled = False
+        if self._background_callback and self._last_bg_color is not None:
+            self._background_callback(self._last_bg_color)
+
     def _handle_ollama_message(self, data):
         """Handle Ollama message from Local AI interface."""
-        import threading
-        import json
-
         msg_type = data.get('type')
 
         if msg_type == 'getModels':
             # Get models in background thread
             def get_models():
                 try:
-                    from ..api.ollama_client import get_ollama_client
-                    client = get_ollama_client()
-                    models = client.get_models()
-                    models_json = json.dumps([{'name': m.name} for m in models])
-                    self._run_js(f"window.receiveModels('{models_json}')")
+                    models_json = self._get_models_json()
+                    # Already canonical JSON, valid as a JS array literal
+                    self._run_js(f"window.receiveModels({models_json})")
                 except Exception as e:
                     logger.error(f"Failed to get Ollama models: {e}")
-                    self._run_js(f"window.receiveError('{str(e)}')")
+                    self._run_js(f"window.receiveError({json.dumps(str(e))})")
 
-            threading.Thread(target=get_models, daemon=True).start()
+            self._executor.submit(get_models)
 
         elif msg_type == 'chat':
             # Chat in background thread
@@ -1042,38 +1492,69 @@ class WebViewManager(NSObject):
                 })
 
             def chat():
+                # Stream tokens as they arrive; the batched JS queue
+                # coalesces bursts of chunks into few bridge round-trips
                 try:
-                    from ..api.ollama_client import get_ollama_client
-                    client = get_ollama_client()
-                    response = client.chat(model, messages)
-                    # Escape for JS
-                    escaped = response.replace('\\', '\\\\').replace("'", "\\'").replace('\n', '\\n')
-                    self._run_js(f"window.receiveResponse('{escaped}')")
+                    client = self._get_ollama()
+                    for chunk in client.chat_stream(model, messages):
+                        self._run_js(
+                            f"window.receiveResponseChunk({json.dumps(chunk)})"
+                        )
+                    self._run_js("window.receiveResponseDone()")
                 except Exception as e:
                     logger.error(f"Ollama chat error: {e}")
-                    self._run_js(f"window.receiveResponse('Error: {str(e)}')")
+                    self._run_js(f"window.receiveResponse({json.dumps(f'Error: {e}')})")
 
-            threading.Thread(target=chat, daemon=True).start()
+            self._executor.submit(chat)
 
     def _run_js(self, js_code):
         """Run JavaScript in webview on main thread."""
-        try:
-            from PyObjCTools import AppHelper
+        if self._is_suspended or not self._web_view:
+            # Evaluating JS while hidden would wake the WebKit process
+            # and undo suspend()'s memory savings; the snippet targets a
+            # page resume() reloads from scratch anyway, so drop it
+            return
+        self._enqueue_js(js_code)
 
-            def run_on_main():
-                if self._web_view:
-                    self._web_view.evaluateJavaScript_completionHandler_(js_code, None)
+    def _enqueue_js(self, js_code):
+        """Queue a JS snippet for the next batched flush.
 
-            AppHelper.callAfter(run_on_main)
+        Safe to call from any thread. Bursts of snippets (streamed
+        tokens, theme updates, focus requests) collapse into a single
+        evaluateJavaScript round-trip ~8ms later.
+        """
+        try:
+            with self._js_lock:
+                self._js_queue.append(js_code)
+                if self._js_flush_scheduled:
+                    return
+                self._js_flush_scheduled = True
+            # callLater needs the main run loop; hop over if we're on a
+            # worker thread
+            AppHelper.callAfter(self._schedule_js_flush)
         except Exception as e:
-            logger.error(f"Failed to run JS: {e}")
+            logger.error(f"Failed to enqueue JS: {e}")
+
+    def _schedule_js_flush(self):
+        """Arm the flush timer (main thread)."""
+        AppHelper.callLater(0.008, self._flush_js)
+
+    def _flush_js(self):
+        """Evaluate all queued snippets in one round-trip (main thread)."""
+        with self._js_lock:
+            queue, self._js_queue = self._js_queue, []
+            self._js_flush_scheduled = False
+        if not queue or not self._web_view:
+            return
+        joined = "(function() {\n" + ";\n".join(queue) + ";\n})();"
+        # None completion handler skips the return-value marshalling
+        self._web_view.evaluateJavaScript_completionHandler_(joined, None)
 
     def _handle_api_chat_message(self, data):
         """Handle chat message from API interface."""
         if not self._current_api_service:
             return
         try:
-            from ..api.api_manager import get_api_manager
             msg_type = data.get('type')
             message = data.get('message')
             if msg_type == 'send' and message:
@@ -1085,52 +1566,64 @@ class WebViewManager(NSObject):
 
     def _send_api_message(self, message: str):
         """Send message to API and handle response."""
-        import threading
-
         def api_call():
             try:
-                from ..api.api_manager import get_api_manager
                 api_manager = get_api_manager()
                 service = self._current_api_service
                 api_key = api_manager.get_api_key(service.id)
                 # Simple OpenAI-compatible API call
-                import urllib.request
-                import json
                 url = service.get_full_url(service.chat_endpoint)
+                # Chat responses are highly compressible text; ask for
+                # gzip (httpx decodes transparently, urllib path below)
                 headers = {
                     "Content-Type": "application/json",
-                    "Authorization": f"Bearer {api_key}"
+                    "Authorization": f"Bearer {api_key}",
+                    "Accept-Encoding": "gzip, deflate"
                 }
                 data = {
                     "model": service.default_model or "gpt-3.5-turbo",
                     "messages": [{"role": "user", "content": message}],
                     "max_tokens": 1000
                 }
-                req = urllib.request.Request(
-                    url,
-                    data=json.dumps(data).encode('utf-8'),
-                    headers=headers,
-                    method="POST"
-                )
-                with urllib.request.urlopen(req, timeout=60) as response:
-                    result = json.loads(response.read().decode('utf-8'))
-                    content = result['choices'][0]['message']['content']
-                    # Send response back to webview
-                    self._send_to_chat(content)
+                http = self._get_http()
+                if http is not None:
+                    # Pooled connection: repeat turns skip TCP+TLS setup;
+                    # pre-serialized body keeps orjson on this path too
+                    resp = http.post(
+                        url, headers=headers, content=_json_dumps_bytes(data)
+                    )
+                    result = _json_loads(resp.content)
+                else:
+                    req = urllib.request.Request(
+                        url,
+                        data=_json_dumps_bytes(data),
+                        headers=headers,
+                        method="POST"
+                    )
+                    with urllib.request.urlopen(req, timeout=60) as response:
+                        body = response.read()
+                        encoding = response.headers.get('Content-Encoding', '')
+                        if encoding == 'gzip':
+                            body = gzip.decompress(body)
+                        elif encoding == 'deflate':
+                            body = zlib.decompress(body)
+                        result = _json_loads(body)
+                content = result['choices'][0]['message']['content']
+                # Send response back to webview
+                self._send_to_chat(content)
             except Exception as e:
                 logger.error(f"API call error: {e}")
                 self._send_to_chat(f"Sorry, there was an error: {str(e)}")
 
         # Run in background thread
-        threading.Thread(target=api_call, daemon=True).start()
+        self._executor.submit(api_call)
 
     def _send_to_chat(self, message: str):
         """Send a message to the chat interface."""
         if self._web_view:
-            # Escape quotes and newlines
-            escaped = message.replace('"', '\\"').replace('\n', '\\n')
-            js = f'window.receiveMessage("{escaped}")'
-            self._web_view.evaluateJavaScript_completionHandler_(js, None)
+            # __overai.recv buffers if the page handler isn't up yet;
+            # json.dumps produces a valid JS string literal in one pass
+            self._enqueue_js(f"__overai.recv({json.dumps(message)})")
 
     def set_background_callback(self, callback: Callable):
         """Set callback for background color changes."""
@@ -1147,9 +1640,12 @@ class WebViewManager(NSObject):
     def cleanup(self):
         """Clean up WebView resources."""
         logger.info("Cleaning up WebView")
-        # Remove memory pressure observer
+        # Cancel the memory pressure dispatch source
         if self._memory_pressure_observer:
-            NSNotificationCenter.defaultCenter().removeObserver_(self)
+            try:
+                libdispatch.dispatch_source_cancel(self._memory_pressure_observer)
+            except Exception:
+                pass
             self._memory_pressure_observer = None
 
         if self._web_view:
@@ -1161,6 +1657,15 @@ class WebViewManager(NSObject):
             self._web_view.removeFromSuperview()
             self._web_view = None
 
+        if self._http is not None:
+            try:
+                self._http.close()
+            except Exception:
+                pass
+            self._http = None
+
+        self._executor.shutdown(wait=False)
+
         self._background_callback = None
         self._is_suspended = False
 
@@ -1178,19 +1683,17 @@ class WebViewManager(NSObject):
             (function() {
                 // Stop all loading
                 window.stop();
-                // Clear all intervals and timeouts
-                var highestId = setTimeout(function() {}, 0);
-                for (var i = 0; i < highestId; i++) {
-                    clearTimeout(i);
-                    clearInterval(i);
+                // Clear live timers via the registry installed at
+                // document start - O(live timers), not O(highest id)
+                if (window.__overai_clearAllTimers) {
+                    window.__overai_clearAllTimers();
                 }
-                // Remove event listeners from body to free memory
+                // Drop the page content outright; resume() reloads the
+                // service anyway, and this avoids the old cloneNode
+                // trick that duplicated the whole DOM (2x peak memory)
                 if (document.body) {
-                    var clone = document.body.cloneNode(true);
-                    document.body.parentNode.replaceChild(clone, document.body);
+                    document.body.replaceChildren();
                 }
-                // Hint to garbage collector
-                if (window.gc) window.gc();
                 return 'suspended';
             })();
             """,
@@ -1211,7 +1714,8 @@ class WebViewManager(NSObject):
         if self._is_suspended:
             logger.info("Resuming WebView")
             self._is_suspended = False
-            # Reload current service
+            # Reload current service; JS dropped while suspended stays
+            # dropped - it targeted the old document
             if self._current_service == 'local_ai':
                 self.load_local_ai()
             else:
@@ -3,15 +3,26 @@ Accessibility support following Apple guidelines.
 VoiceOver, keyboard navigation, and accessibility features.
 """
 
+import time
+from bisect import bisect_right
+
 import objc
 from AppKit import (
-    NSView, NSButton, NSPopUpButton, NSTextField,
+    NSView, NSButton, NSPopUpButton, NSTextField, NSWorkspace,
     NSAccessibilityRole, NSAccessibilityButtonRole,
     NSAccessibilityPopUpButtonRole, NSAccessibilityStaticTextRole,
-    NSAccessibilityDescriptionAttribute
+    NSAccessibilityDescriptionAttribute,
+    NSAccessibilityPostNotificationWithUserInfo,
+    NSAccessibilityAnnouncementRequestedNotification,
+    NSAccessibilityAnnouncementKey, NSApp
 )
 from Foundation import NSObject
 
+# How long a VoiceOver running-state probe stays fresh
+_VO_CHECK_TTL = 2.0  # seconds
+
+VOICEOVER_BUNDLE_ID = "com.apple.VoiceOver"
+
 
 class AccessibilityManager:
     """
@@ -21,6 +32,8 @@ class AccessibilityManager:
     
     def __init__(self):
         self._elements = []
+        # (timestamp, running) cache for the VoiceOver check
+        self._vo_state = (0.0, False)
     
     def configure_button(self, button: NSButton, 
                          label: str, 
@@ -65,26 +78,38 @@ class AccessibilityManager:
         view.setAccessibilityHelp_("Main content area showing AI chat interface")
     
     def is_voiceover_running(self) -> bool:
-        """Check if VoiceOver is running."""
+        """Check if VoiceOver is running (cached for a couple seconds).
+
+        Scans NSWorkspace's running applications in-process instead of
+        forking a pgrep per call.
+        """
+        now = time.monotonic()
+        ts, running = self._vo_state
+        if now - ts < _VO_CHECK_TTL:
+            return running
         try:
-            from ApplicationServices import AXIsProcessTrusted
-            # VoiceOver typically runs as VoiceOver.app
-            import subprocess
-            result = subprocess.run(
-                ["pgrep", "-x", "VoiceOver"],
-                capture_output=True
+            apps = NSWorkspace.sharedWorkspace().runningApplications()
+            running = any(
+                app.bundleIdentifier() == VOICEOVER_BUNDLE_ID for app in apps
             )
-            return result.returncode == 0
-        except:
-            return False
-    
+        except Exception:
+            running = False
+        self._vo_state = (now, running)
+        return running
+
     def announce(self, message: str):
         """Announce message to VoiceOver users."""
-        if self.is_voiceover_running():
-            # Use AppleScript to announce
-            import subprocess
-            script = f'display notification "{message}" with title "OverAI"'
-            subprocess.run(["osascript", "-e", script], capture_output=True)
+        if not self.is_voiceover_running():
+            return
+        try:
+            # Native announcement request - no osascript fork
+            NSAccessibilityPostNotificationWithUserInfo(
+                NSApp,
+                NSAccessibilityAnnouncementRequestedNotification,
+                {NSAccessibilityAnnouncementKey: message}
+            )
+        except Exception:
+            pass
 
 
 class KeyboardNavigator:
@@ -95,12 +120,34 @@ class KeyboardNavigator:
     
     def __init__(self):
         self._focus_order = []
+        self._order_keys = []  # parallel list of orders, kept sorted
         self._current_focus = 0
-    
+        # view id -> focus index, rebuilt lazily after registrations
+        self._view_index = {}
+        self._index_dirty = False
+
     def register_focusable(self, view, order: int):
         """Register a view in the focus order."""
-        self._focus_order.append((order, view))
-        self._focus_order.sort(key=lambda x: x[0])
+        # Binary insert keeps the list sorted without re-sorting the
+        # whole thing on every registration
+        i = bisect_right(self._order_keys, order)
+        self._order_keys.insert(i, order)
+        self._focus_order.insert(i, (order, view))
+        self._index_dirty = True
+
+    def set_focus(self, view):
+        """Jump focus directly to a registered view."""
+        if self._index_dirty:
+            self._view_index = {
+                id(v): i for i, (_, v) in enumerate(self._focus_order)
+            }
+            self._index_dirty = False
+        index = self._view_index.get(id(view))
+        if index is None:
+            return
+        self._current_focus = index
+        if hasattr(view, 'becomeFirstResponder'):
+            view.becomeFirstResponder()
     
     def next_focus(self):
         """Move focus to next element."""
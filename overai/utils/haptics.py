@@ -19,46 +19,51 @@ class HapticFeedbackManager:
     
     def __init__(self):
         self._feedback_performer = None
+        # Bound performer method; one C-level dispatch per call instead
+        # of an attribute chain plus try/except
+        self._perform = None
+        self._enabled = False
         self._initialize()
-    
+
     def _initialize(self):
-        """Initialize the haptic feedback performer."""
+        """Initialize the haptic feedback performer.
+
+        Probes with a real pattern once, so machines without a Force
+        Touch device (external mouse, Mac mini) fail here instead of
+        raising on every feedback call during slider drags.
+        """
         try:
             # Get the default haptic feedback manager
             manager = NSHapticFeedbackManager.defaultHapticFeedbackManager()
-            if manager:
-                self._feedback_performer = manager
-                logger.debug("Haptic feedback initialized")
+            if manager is None:
+                logger.debug("Haptic feedback not available")
+                return
+            perform = manager.performFeedbackPattern_performancer_
+            perform(NSHapticFeedbackPatternAlignment, None)
+            self._feedback_performer = manager
+            self._perform = perform
+            self._enabled = True
+            logger.debug("Haptic feedback initialized")
         except Exception as e:
             logger.debug(f"Haptic feedback not available: {e}")
-    
+
     def alignment_feedback(self):
         """
         Provides alignment feedback - used for snap-to points.
         Good for opacity adjustments reaching min/max.
         """
-        if self._feedback_performer:
-            try:
-                self._feedback_performer.performFeedbackPattern_performancer_(
-                    NSHapticFeedbackPatternAlignment,
-                    None
-                )
-            except Exception as e:
-                logger.debug(f"Alignment feedback failed: {e}")
-    
+        if not self._enabled:
+            return
+        self._perform(NSHapticFeedbackPatternAlignment, None)
+
     def level_change_feedback(self):
         """
         Provides level change feedback - used for discrete value changes.
         Good for service switching or opacity steps.
         """
-        if self._feedback_performer:
-            try:
-                self._feedback_performer.performFeedbackPattern_performancer_(
-                    NSHapticFeedbackPatternLevelChange,
-                    None
-                )
-            except Exception as e:
-                logger.debug(f"Level change feedback failed: {e}")
+        if not self._enabled:
+            return
+        self._perform(NSHapticFeedbackPatternLevelChange, None)
     
     def generic_feedback(self):
         """Generic feedback for general interactions."""
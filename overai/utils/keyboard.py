@@ -5,10 +5,8 @@ Optimized keyboard handling with event tap management.
 import json
 import time
 from pathlib import Path
-from typing import Callable, Optional, Dict, Any
-from dataclasses import dataclass
+from typing import Callable, Optional, Dict, Any, NamedTuple
 
-import objc
 from Quartz import (
     CGEventTapCreate, CGEventTapEnable, CFMachPortCreateRunLoopSource,
     CFRunLoopAddSource, CFRunLoopGetCurrent, kCFRunLoopCommonModes,
@@ -38,13 +36,38 @@ SPECIAL_KEYS = {
     116: "Page Up", 121: "Page Down", 119: "End", 115: "Home"
 }
 
+# ANSI (US) layout character keys by virtual keycode
+_ANSI_KEYS = {
+    0: "A", 1: "S", 2: "D", 3: "F", 4: "H", 5: "G", 6: "Z", 7: "X",
+    8: "C", 9: "V", 11: "B", 12: "Q", 13: "W", 14: "E", 15: "R",
+    16: "Y", 17: "T", 18: "1", 19: "2", 20: "3", 21: "4", 22: "6",
+    23: "5", 24: "=", 25: "9", 26: "7", 27: "-", 28: "8", 29: "0",
+    30: "]", 31: "O", 32: "U", 33: "[", 34: "I", 35: "P", 37: "L",
+    38: "J", 39: "'", 40: "K", 41: ";", 42: "\\", 43: ",", 44: "/",
+    45: "N", 46: "M", 47: ".", 50: "`"
+}
+
+# Flat 256-entry lookup table: keycode -> display name (or None).
+# One indexed load instead of two dict probes plus a chr() fallback
+# that produced garbage for most keycodes.
+_KEYCODE_TABLE = [None] * 256
+for _code, _name in SPECIAL_KEYS.items():
+    _KEYCODE_TABLE[_code] = _name
+for _code, _name in _ANSI_KEYS.items():
+    _KEYCODE_TABLE[_code] = _name
+del _code, _name
+
 
-@dataclass
-class HotkeyConfig:
-    """Immutable hotkey configuration."""
+class HotkeyConfig(NamedTuple):
+    """Immutable hotkey configuration.
+
+    A NamedTuple rather than a dataclass: truly immutable, no per-
+    instance __dict__, and C-speed field access.
+    """
     flags: int
     keycode: int
-    
+
+
     def to_dict(self) -> Dict[str, int]:
         return {"flags": self.flags, "keycode": self.keycode}
     
@@ -77,9 +100,14 @@ class KeyboardManager:
         self._hotkey = DEFAULT_HOTKEY
         self._callback: Optional[Callable] = None
         self._is_listening = False
-        self._last_trigger_time = 0
         self._debounce_ms = 200  # Prevent rapid triggering
-        
+        # [flags, keycode] snapshot shared with the tap callback closure;
+        # save_hotkey updates it in place while listening
+        self._hk_snapshot = None
+        self._event_handler_ref = None
+        # Composed display string, rebuilt only when the hotkey changes
+        self._hotkey_string = None
+
         # Ensure directory exists
         self.CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
         
@@ -93,6 +121,7 @@ class KeyboardManager:
                 with open(self.CONFIG_PATH, 'r') as f:
                     data = json.load(f)
                     self._hotkey = HotkeyConfig.from_dict(data)
+                    self._hotkey_string = None
                     logger.info(f"Loaded hotkey: {self.get_hotkey_string()}")
         except Exception as e:
             logger.error(f"Failed to load hotkey: {e}")
@@ -100,6 +129,11 @@ class KeyboardManager:
     def save_hotkey(self, flags: int, keycode: int):
         """Save hotkey to config."""
         self._hotkey = HotkeyConfig(flags=flags, keycode=keycode)
+        self._hotkey_string = None
+        # Re-snapshot for the live tap callback
+        if self._hk_snapshot is not None:
+            self._hk_snapshot[0] = flags
+            self._hk_snapshot[1] = keycode
         try:
             with open(self.CONFIG_PATH, 'w') as f:
                 json.dump(self._hotkey.to_dict(), f)
@@ -113,14 +147,46 @@ class KeyboardManager:
             return
         
         self._callback = callback
-        
+
+        # The tap callback runs for every keydown system-wide, so all
+        # hot-path state is snapshotted into closure cells: no self.*
+        # attribute lookups per event, just LOAD_DEREF + C calls
+        hk = [self._hotkey.flags, self._hotkey.keycode]
+        self._hk_snapshot = hk
+        debounce_s = self._debounce_ms / 1000.0
+        monotonic = time.monotonic
+        key_down = kCGEventKeyDown
+        get_field = CGEventGetIntegerValueField
+        keycode_field = kCGKeyboardEventKeycode
+        get_flags = CGEventGetFlags
+        last_trigger = [0.0]
+
+        def handler(proxy, event_type, event, refcon):
+            if event_type != key_down:
+                return event
+            # Cheapest test first; most keydowns are not the hotkey
+            if get_field(event, keycode_field) != hk[1]:
+                return event
+            if (get_flags(event) & hk[0]) != hk[0]:
+                return event
+            now = monotonic()
+            if now - last_trigger[0] < debounce_s:
+                return None  # Swallow rapid re-trigger
+            last_trigger[0] = now
+            if callback:
+                callback()
+            return None  # Swallow the event
+
+        # Keep a reference so the C callback stays alive
+        self._event_handler_ref = handler
+
         # Create event tap
         self._event_tap = CGEventTapCreate(
             kCGHIDEventTap,
             kCGHeadInsertEventTap,
             kCGEventTapOptionDefault,
             CGEventMaskBit(kCGEventKeyDown),
-            self._event_handler,
+            handler,
             None
         )
         
@@ -161,57 +227,35 @@ class KeyboardManager:
         
         self._is_listening = False
         self._callback = None
-        
+        self._event_handler_ref = None
+        self._hk_snapshot = None
+
         logger.info("Keyboard listener stopped")
-    
-    def _event_handler(self, proxy, event_type, event, refcon):
-        """Handle keyboard events."""
-        if event_type != kCGEventKeyDown:
-            return event
-        
-        keycode = CGEventGetIntegerValueField(event, kCGKeyboardEventKeycode)
-        flags = CGEventGetFlags(event)
-        
-        # Check debounce
-        current_time = time.time() * 1000
-        if current_time - self._last_trigger_time < self._debounce_ms:
-            return None  # Swallow event
-        
-        # Check if matches our hotkey
-        if self._hotkey.matches(flags, keycode):
-            self._last_trigger_time = current_time
-            if self._callback:
-                self._callback()
-            return None  # Swallow the event
-        
-        return event
-    
+
     def get_hotkey_string(self) -> str:
-        """Get human-readable hotkey string."""
+        """Get human-readable hotkey string (memoized)."""
+        if self._hotkey_string is not None:
+            return self._hotkey_string
+
         modifiers = []
-        
+
         if self._hotkey.flags & kCGEventFlagMaskCommand:
             modifiers.append("⌘")
-        if self._hotkey.flags & kCGEventFlagMaskOption:
+        if self._hotkey.flags & kCGEventFlagMaskAlternate:
             modifiers.append("⌥")
         if self._hotkey.flags & kCGEventFlagMaskControl:
             modifiers.append("⌃")
         if self._hotkey.flags & kCGEventFlagMaskShift:
             modifiers.append("⇧")
-        
-        key = SPECIAL_KEYS.get(self._hotkey.keycode, chr(self._hotkey.keycode + 93))
-        
-        return " + ".join(modifiers + [key]) if modifiers else key
+
+        keycode = self._hotkey.keycode
+        key = _KEYCODE_TABLE[keycode] if 0 <= keycode < 256 else None
+        if key is None:
+            key = "?"
+
+        self._hotkey_string = " + ".join(modifiers + [key]) if modifiers else key
+        return self._hotkey_string
     
     def cleanup(self):
         """Cleanup resources."""
         self.stop_listening()
-
-
-# C function callback needs to be at module level for stability
-def create_event_handler(manager: KeyboardManager):
-    """Create stable event handler callback."""
-    @objc.callbackFor(CGEventTapCreate)
-    def handler(proxy, event_type, event, refcon):
-        return manager._event_handler(proxy, event_type, event, refcon)
-    return handler
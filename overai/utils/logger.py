@@ -5,19 +5,41 @@ Optimized with log rotation and buffer limits.
 
 import os
 import sys
+import time
+import atexit
+import queue
+import weakref
+import threading
 from pathlib import Path
-from datetime import datetime
 from typing import Optional
-from enum import Enum
+from enum import IntEnum
 
 
-class LogLevel(Enum):
+class LogLevel(IntEnum):
     DEBUG = 0
     INFO = 1
     WARNING = 2
     ERROR = 3
 
 
+# Level marker bytes, resolved once instead of level.name[0] per line
+_LEVEL_CHAR = {
+    LogLevel.DEBUG: b"D",
+    LogLevel.INFO: b"I",
+    LogLevel.WARNING: b"W",
+    LogLevel.ERROR: b"E",
+}
+
+
+def _noop(*args):
+    """Stand-in for filtered level methods: one C-level call, no compare."""
+
+
+# POSIX (including macOS) can submit a whole batch of line buffers in
+# one syscall without first copying them into a joined bytes object
+_HAS_WRITEV = hasattr(os, "writev")
+
+
 class Logger:
     """
     Simple, efficient logger with lazy file initialization and log rotation.
@@ -25,17 +47,54 @@ class Logger:
     """
     
     _LOG_DIR = Path.home() / "Library" / "Logs" / "OverAI"
-    _FILE_HANDLE = None
+    _FD = None  # Raw O_APPEND file descriptor; writes skip io buffering
     _INITIALIZED = False
     _MIN_LEVEL = LogLevel.INFO  # Default to INFO to reduce log volume
+    _MIN_LEVEL_INT = LogLevel.INFO.value  # Plain int for hot-path compares
+    _instances = weakref.WeakSet()
+    # Public enabled flags, kept in sync by set_level. Call sites with
+    # expensive message construction can guard on `if Logger.DEBUG:`
+    # and pay a single boolean load when the level is filtered.
+    DEBUG = False
+    INFO = True
     _MAX_FILE_SIZE = 5 * 1024 * 1024  # 5 MB max log file size
-    _MAX_BUFFER_LINES = 100  # Limit in-memory buffer
-    _buffer = []
-    
+    _QUEUE_SIZE = 10000      # Bounded: memory stays flat under burst
+    _BATCH_LINES = 512       # Max lines coalesced into one write
+    _FLUSH_INTERVAL = 0.25   # Idle flush period for the drain thread
+    _queue: Optional[queue.Queue] = None
+    _drain_thread = None
+    _bytes_written = 0  # Maintained by the drain thread for rotation
+    # Timestamp cache: strftime only runs when the second ticks over
+    _last_sec = 0
+    _last_stamp = b""
+
     def __init__(self, name: str):
         self.name = name
+        # Fixed part of every line from this logger, encoded once
+        self._prefix_tail = f"] [{name}] ".encode('utf-8')
         self._ensure_initialized()
-    
+        Logger._instances.add(self)
+        self._apply_level()
+
+    def _apply_level(self):
+        """Rebind level methods below the threshold to a no-op.
+
+        A filtered logger.debug(...) then costs one C-level call that
+        returns immediately - no enum compare, no _log frame.
+        """
+        min_int = Logger._MIN_LEVEL_INT
+        for lvl, name in (
+            (LogLevel.DEBUG, 'debug'),
+            (LogLevel.INFO, 'info'),
+            (LogLevel.WARNING, 'warning'),
+        ):
+            if lvl < min_int:
+                setattr(self, name, _noop)
+            elif name in self.__dict__:
+                # Drop the shadow so the real class method shows again
+                delattr(self, name)
+
+
     @classmethod
     def _ensure_initialized(cls):
         """Lazy initialization of log directory and file."""
@@ -43,78 +102,203 @@ class Logger:
             return
         
         cls._LOG_DIR.mkdir(parents=True, exist_ok=True)
-        
-        # Check for log rotation
+
+        # Raw fd: os.write skips the TextIOWrapper/BufferedWriter
+        # layers (locks, encoder state), and O_APPEND makes each write
+        # land atomically at the end of the file
         log_file = cls._LOG_DIR / "overai.log"
-        if log_file.exists():
+        cls._FD = os.open(
+            str(log_file), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+        )
+        # Running size counter seeds rotation checks; one fstat here
+        # replaces per-call stat()s (an oversized leftover file rotates
+        # after the first batch)
+        try:
+            cls._bytes_written = os.fstat(cls._FD).st_size
+        except Exception:
+            cls._bytes_written = 0
+
+        # All file I/O happens on a background drain thread; callers
+        # only pay the cost of an enqueue
+        cls._queue = queue.Queue(maxsize=cls._QUEUE_SIZE)
+        cls._drain_thread = threading.Thread(
+            target=cls._drain, name="overai-log", daemon=True
+        )
+        cls._drain_thread.start()
+        atexit.register(cls._drain_and_close)
+
+        cls._INITIALIZED = True
+
+    @classmethod
+    def _drain(cls):
+        """Drain loop: coalesce queued lines into batched writes."""
+        q = cls._queue
+        batch = []
+        while True:
             try:
-                size = log_file.stat().st_size
-                if size > cls._MAX_FILE_SIZE:
-                    # Rotate: rename old log
-                    old_log = cls._LOG_DIR / "overai.old.log"
-                    if old_log.exists():
-                        old_log.unlink()
-                    log_file.rename(old_log)
-            except Exception:
+                batch.append(q.get(timeout=cls._FLUSH_INTERVAL))
+            except queue.Empty:
+                # Nothing buffered in userspace; O_APPEND writes are
+                # already with the OS
+                continue
+            # Coalesce whatever else is already queued, one write total
+            try:
+                while len(batch) < cls._BATCH_LINES:
+                    batch.append(q.get_nowait())
+            except queue.Empty:
                 pass
-        
-        # Open log file with buffering for performance
-        cls._FILE_HANDLE = open(log_file, 'a', buffering=8192)  # 8KB buffer
-        
-        cls._INITIALIZED = True
+            fd = cls._FD
+            if fd is not None:
+                try:
+                    if _HAS_WRITEV:
+                        # One syscall for the whole batch, no join copy
+                        cls._bytes_written += cls._writev_all(fd, batch)
+                    else:
+                        data = b"".join(batch)
+                        cls._bytes_written += os.write(fd, data)
+                except Exception:
+                    pass
+                if cls._bytes_written > cls._MAX_FILE_SIZE:
+                    cls._rotate()
+            batch.clear()
+
+    @staticmethod
+    def _writev_all(fd, buffers):
+        """writev the buffer list fully, re-issuing after short writes.
+
+        Mutates the list; callers clear it afterwards anyway. Returns
+        the number of bytes written.
+        """
+        total = 0
+        while buffers:
+            n = os.writev(fd, buffers)
+            total += n
+            while buffers and n >= len(buffers[0]):
+                n -= len(buffers[0])
+                del buffers[0]
+            if n:
+                buffers[0] = buffers[0][n:]
+        return total
+
+    @classmethod
+    def _rotate(cls):
+        """Swap in a fresh log file (drain thread only)."""
+        log_file = cls._LOG_DIR / "overai.log"
+        try:
+            os.replace(log_file, cls._LOG_DIR / "overai.old.log")
+            old_fd = cls._FD
+            cls._FD = os.open(
+                str(log_file), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+            )
+            cls._bytes_written = 0
+            if old_fd is not None:
+                os.close(old_fd)
+        except Exception:
+            pass
+
+    @classmethod
+    def _drain_and_close(cls):
+        """Write out anything still queued and close the file (atexit)."""
+        q = cls._queue
+        if q is not None:
+            lines = []
+            try:
+                while True:
+                    lines.append(q.get_nowait())
+            except queue.Empty:
+                pass
+            if lines and cls._FD is not None:
+                try:
+                    os.write(cls._FD, b"".join(lines))
+                except Exception:
+                    pass
+        cls.close()
+    
+    def isEnabledFor(self, level: LogLevel) -> bool:
+        """Check whether a level would be logged, for guarding
+        expensive message construction at call sites."""
+        return level >= Logger._MIN_LEVEL_INT
     
-    def _log(self, level: LogLevel, message: str):
+    def _log(self, level: LogLevel, message: str, *args):
         """Internal log method with memory-efficient buffering."""
-        if level.value < self._MIN_LEVEL.value:
+        if level < Logger._MIN_LEVEL_INT:
             return
         
-        timestamp = datetime.now().strftime("%H:%M:%S")  # Shorter timestamp
-        log_line = f"[{timestamp}] [{level.name[0]}] [{self.name}] {message}\n"
+        # Deferred %-formatting: only pay for it when the line is emitted
+        if args:
+            message = message % args
         
-        # Write to file
-        if self._FILE_HANDLE:
+        # All lines within the same wall-clock second share one
+        # formatted stamp; strftime is far pricier than the int compare
+        sec = int(time.time())
+        if sec != Logger._last_sec:
+            Logger._last_stamp = time.strftime(
+                "%H:%M:%S", time.localtime(sec)
+            ).encode('ascii')
+            Logger._last_sec = sec
+
+        # One join over prebuilt byte fragments: no f-string parsing,
+        # only the message itself is encoded per call
+        encoded = b"".join((
+            b"[", Logger._last_stamp, b"] [", _LEVEL_CHAR[level],
+            self._prefix_tail, message.encode('utf-8'), b"\n",
+        ))
+
+        # Hand off to the drain thread; on overflow drop the oldest
+        # line so a burst costs a line, not caller latency
+        q = self._queue
+        if q is not None:
             try:
-                self._FILE_HANDLE.write(log_line)
-            except Exception:
-                pass
-        
+                q.put_nowait(encoded)
+            except queue.Full:
+                try:
+                    q.get_nowait()
+                    q.put_nowait(encoded)
+                except (queue.Empty, queue.Full):
+                    pass
+
         # Print to console only for warnings/errors
-        if level.value >= LogLevel.WARNING.value:
-            print(log_line, end='', file=sys.stderr)
-    
-    def debug(self, message: str):
-        self._log(LogLevel.DEBUG, message)
+        if level >= LogLevel.WARNING:
+            sys.stderr.write(encoded.decode('utf-8', 'replace'))
     
-    def info(self, message: str):
-        self._log(LogLevel.INFO, message)
+    def debug(self, message: str, *args):
+        Logger.DEBUG and self._log(LogLevel.DEBUG, message, *args)
+
+    def info(self, message: str, *args):
+        Logger.INFO and self._log(LogLevel.INFO, message, *args)
     
-    def warning(self, message: str):
-        self._log(LogLevel.WARNING, message)
+    def warning(self, message: str, *args):
+        self._log(LogLevel.WARNING, message, *args)
     
-    def error(self, message: str):
-        self._log(LogLevel.ERROR, message)
+    def error(self, message: str, *args):
+        self._log(LogLevel.ERROR, message, *args)
     
     @classmethod
     def set_level(cls, level: LogLevel):
         """Set minimum log level."""
         cls._MIN_LEVEL = level
+        cls._MIN_LEVEL_INT = int(level)
+        cls.DEBUG = level <= LogLevel.DEBUG
+        cls.INFO = level <= LogLevel.INFO
+        for instance in list(cls._instances):
+            instance._apply_level()
     
     @classmethod
     def flush(cls):
-        """Flush log buffer to disk."""
-        if cls._FILE_HANDLE:
-            try:
-                cls._FILE_HANDLE.flush()
-            except Exception:
-                pass
+        """Kept for API compatibility; O_APPEND writes are unbuffered."""
     
     @classmethod
     def close(cls):
-        """Close log file handle."""
-        if cls._FILE_HANDLE:
+        """Sync and close the log file descriptor."""
+        fd = cls._FD
+        if fd is not None:
+            cls._FD = None
+            cls._INITIALIZED = False
             try:
-                cls._FILE_HANDLE.close()
+                os.fsync(fd)
+            except Exception:
+                pass
+            try:
+                os.close(fd)
             except Exception:
                 pass
-            cls._FILE_HANDLE = None
-            cls._INITIALIZED = False
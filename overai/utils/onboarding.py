@@ -5,36 +5,64 @@ Beautiful, Apple-style permission request flow like Raycast and Alfred.
 
 import os
 import sys
+import time
 import objc
 from Foundation import (
     NSObject, NSMakeRect, NSTimer, NSNotificationCenter,
     NSURL, NSBundle, NSDictionary
 )
-from AppKit import (
-    NSWindow, NSView, NSButton, NSTextField, NSImageView,
-    NSColor, NSFont, NSImage, NSBezierPath,
-    NSWindowStyleMaskTitled, NSWindowStyleMaskClosable,
-    NSBackingStoreBuffered, NSModalResponseOK, NSModalResponseCancel,
-    NSVisualEffectView, NSVisualEffectMaterialWindowBackground,
-    NSTextAlignmentCenter, NSLineBreakByWordWrapping,
-    NSApp, NSWorkspace, NSBezelStyleRounded,
-    NSViewWidthSizable, NSViewMinYMargin, NSViewMaxYMargin,
-    NSScreen
-)
 from ApplicationServices import AXIsProcessTrustedWithOptions, kAXTrustedCheckOptionPrompt
 
 from .logger import Logger
 
 logger = Logger("OnboardingWindow")
 
+# AppKit symbols used by the window UI. In the common case the
+# permission is already granted and the window never shows, so the
+# bulk of the Cocoa class metadata is resolved lazily on first show()
+# instead of at module import (which happens on every launch).
+_APPKIT_NAMES = (
+    "NSWindow", "NSButton", "NSTextField", "NSImageView",
+    "NSColor", "NSFont", "NSImage",
+    "NSWindowStyleMaskTitled", "NSWindowStyleMaskClosable",
+    "NSBackingStoreBuffered",
+    "NSVisualEffectView", "NSVisualEffectMaterialWindowBackground",
+    "NSTextAlignmentCenter",
+    "NSApp", "NSWorkspace", "NSBezelStyleRounded",
+    "NSViewWidthSizable", "NSViewMinYMargin", "NSViewMaxYMargin",
+    "NSScreen",
+)
+_appkit_loaded = False
 
-# Use a simple Python class wrapper instead of NSObject subclass
-# to avoid PyObjC method signature issues
-class OnboardingHelper:
-    """Helper class for window delegate and timer handling."""
-    
-    def __init__(self, parent):
-        self.parent = parent
+_WINDOW_WIDTH = 480
+_WINDOW_HEIGHT = 400
+_BTN_W, _BTN_H, _BTN_Y, _BTN_SPACING = 180, 32, 40, 20
+_BTN_START_X = (_WINDOW_WIDTH - (_BTN_W * 2 + _BTN_SPACING)) / 2
+
+# Subview frames resolved once at import: the window is fixed-size, so
+# the centering arithmetic and NSMakeRect calls don't repeat per view
+# every time the window is built
+_LAYOUT = {
+    'icon': NSMakeRect((_WINDOW_WIDTH - 80) / 2, _WINDOW_HEIGHT - 120, 80, 80),
+    'title': NSMakeRect(40, _WINDOW_HEIGHT - 160, _WINDOW_WIDTH - 80, 30),
+    'description': NSMakeRect(40, _WINDOW_HEIGHT - 290, _WINDOW_WIDTH - 80, 120),
+    'status': NSMakeRect(40, 100, _WINDOW_WIDTH - 80, 24),
+    'settings_btn': NSMakeRect(_BTN_START_X, _BTN_Y, _BTN_W, _BTN_H),
+    'continue_btn': NSMakeRect(
+        _BTN_START_X + _BTN_W + _BTN_SPACING, _BTN_Y, _BTN_W, _BTN_H
+    ),
+}
+
+
+def _load_appkit():
+    """Resolve the AppKit symbols into module globals on first use."""
+    global _appkit_loaded
+    if _appkit_loaded:
+        return
+    import AppKit
+    for name in _APPKIT_NAMES:
+        globals()[name] = getattr(AppKit, name)
+    _appkit_loaded = True
 
 
 class OnboardingWindowDelegate(NSObject):
@@ -47,21 +75,15 @@ class OnboardingWindowDelegate(NSObject):
         if self.parent:
             self.parent.handle_close()
 
-
-class OnboardingTimerHandler(NSObject):
-    """Timer handler."""
-    
-    parent = objc.ivar()
-    
-    def checkPermission_(self, timer):
-        """Check if permission was granted."""
+    def windowDidBecomeKey_(self, notification):
+        """Window came to front - resume permission polling."""
         if self.parent:
-            self.parent.check_permission()
-    
-    def autoRestart_(self, timer):
-        """Auto-restart after permission granted."""
+            self.parent.handle_become_key()
+
+    def windowDidResignKey_(self, notification):
+        """Window went to background - pause permission polling."""
         if self.parent:
-            self.parent.do_restart()
+            self.parent.handle_resign_key()
 
 
 class OnboardingButtonHandler(NSObject):
@@ -87,12 +109,20 @@ class OnboardingWindow:
     Uses composition instead of NSObject inheritance to avoid PyObjC issues.
     """
     
-    WINDOW_WIDTH = 480
-    WINDOW_HEIGHT = 400
-    
+    WINDOW_WIDTH = _WINDOW_WIDTH
+    WINDOW_HEIGHT = _WINDOW_HEIGHT
+
+    # (timestamp, trusted) cache for the AX trust probe, which traps
+    # into the WindowServer; show(), the poll timer and handle_close()
+    # can all land within the same tick
+    _trust_cache = (0.0, False)
+    _TRUST_TTL = 0.25  # seconds
+
     def __init__(self):
         self.window = None
         self.check_timer = None
+        self._poll_interval = 0.5
+        self._granted = False
         self.completion_callback = None
         self.status_label = None
         self.open_settings_btn = None
@@ -101,10 +131,7 @@ class OnboardingWindow:
         # Create delegate and handlers
         self.delegate = OnboardingWindowDelegate.alloc().init()
         self.delegate.parent = self
-        
-        self.timer_handler = OnboardingTimerHandler.alloc().init()
-        self.timer_handler.parent = self
-        
+
         self.button_handler = OnboardingButtonHandler.alloc().init()
         self.button_handler.parent = self
     
@@ -120,6 +147,7 @@ class OnboardingWindow:
             return
         
         # Create and show window
+        _load_appkit()
         self.create_window()
         self.window.makeKeyAndOrderFront_(None)
         NSApp.activateIgnoringOtherApps_(True)
@@ -128,11 +156,17 @@ class OnboardingWindow:
         self.start_permission_check()
     
     def is_trusted(self) -> bool:
-        """Check if accessibility permission is granted."""
+        """Check if accessibility permission is granted (cached briefly)."""
+        now = time.monotonic()
+        ts, trusted = OnboardingWindow._trust_cache
+        if now - ts < self._TRUST_TTL:
+            return trusted
         try:
-            return AXIsProcessTrustedWithOptions(None)
+            trusted = bool(AXIsProcessTrustedWithOptions(None))
         except:
-            return False
+            trusted = False
+        OnboardingWindow._trust_cache = (now, trusted)
+        return trusted
     
     def create_window(self):
         """Create the beautiful onboarding window."""
@@ -173,13 +207,7 @@ class OnboardingWindow:
     
     def add_icon(self, parent):
         """Add app icon at top."""
-        icon_size = 80
-        x = (self.WINDOW_WIDTH - icon_size) / 2
-        y = self.WINDOW_HEIGHT - icon_size - 40
-        
-        icon_view = NSImageView.alloc().initWithFrame_(
-            NSMakeRect(x, y, icon_size, icon_size)
-        )
+        icon_view = NSImageView.alloc().initWithFrame_(_LAYOUT['icon'])
         
         # Try to load app icon, fallback to SF Symbol
         app_icon = NSImage.imageNamed_("NSApplicationIcon")
@@ -199,9 +227,7 @@ class OnboardingWindow:
     
     def add_title(self, parent):
         """Add title text."""
-        title = NSTextField.alloc().initWithFrame_(
-            NSMakeRect(40, self.WINDOW_HEIGHT - 160, self.WINDOW_WIDTH - 80, 30)
-        )
+        title = NSTextField.alloc().initWithFrame_(_LAYOUT['title'])
         title.setStringValue_("OverAI needs Accessibility Permission")
         title.setBezeled_(False)
         title.setDrawsBackground_(False)
@@ -223,9 +249,7 @@ class OnboardingWindow:
             "keyboard shortcuts, never your screen content."
         )
         
-        desc = NSTextField.alloc().initWithFrame_(
-            NSMakeRect(40, self.WINDOW_HEIGHT - 290, self.WINDOW_WIDTH - 80, 120)
-        )
+        desc = NSTextField.alloc().initWithFrame_(_LAYOUT['description'])
         desc.setStringValue_(desc_text)
         desc.setBezeled_(False)
         desc.setDrawsBackground_(False)
@@ -238,11 +262,7 @@ class OnboardingWindow:
     
     def add_status_indicator(self, parent):
         """Add status indicator showing current permission state."""
-        status_y = 100
-        
-        self.status_label = NSTextField.alloc().initWithFrame_(
-            NSMakeRect(40, status_y, self.WINDOW_WIDTH - 80, 24)
-        )
+        self.status_label = NSTextField.alloc().initWithFrame_(_LAYOUT['status'])
         self.status_label.setBezeled_(False)
         self.status_label.setDrawsBackground_(False)
         self.status_label.setEditable_(False)
@@ -266,17 +286,9 @@ class OnboardingWindow:
     
     def add_buttons(self, parent):
         """Add action buttons."""
-        button_width = 180
-        button_height = 32
-        button_y = 40
-        spacing = 20
-        
-        total_width = button_width * 2 + spacing
-        start_x = (self.WINDOW_WIDTH - total_width) / 2
-        
         # Open System Settings button (primary)
         self.open_settings_btn = NSButton.alloc().initWithFrame_(
-            NSMakeRect(start_x, button_y, button_width, button_height)
+            _LAYOUT['settings_btn']
         )
         self.open_settings_btn.setTitle_("Open System Settings")
         self.open_settings_btn.setBezelStyle_(NSBezelStyleRounded)
@@ -287,7 +299,7 @@ class OnboardingWindow:
         
         # Continue button (disabled until permission granted)
         self.continue_btn = NSButton.alloc().initWithFrame_(
-            NSMakeRect(start_x + button_width + spacing, button_y, button_width, button_height)
+            _LAYOUT['continue_btn']
         )
         self.continue_btn.setTitle_("Continue")
         self.continue_btn.setBezelStyle_(NSBezelStyleRounded)
@@ -299,7 +311,11 @@ class OnboardingWindow:
     def open_settings(self):
         """Open System Settings to Accessibility pane."""
         logger.info("Opening System Settings > Accessibility")
-        
+
+        # The user is about to flip the permission; next check must hit
+        # the real API
+        OnboardingWindow._trust_cache = (0.0, False)
+
         # Open directly to Privacy > Accessibility
         url = NSURL.URLWithString_(
             "x-apple.systempreferences:com.apple.preference.security?Privacy_Accessibility"
@@ -313,38 +329,66 @@ class OnboardingWindow:
         AXIsProcessTrustedWithOptions(options)
     
     def start_permission_check(self):
-        """Start polling for permission grant."""
-        # Check every 0.5 seconds
-        self.check_timer = NSTimer.scheduledTimerWithTimeInterval_target_selector_userInfo_repeats_(
-            0.5,
-            self.timer_handler,
-            "checkPermission:",
-            None,
-            True
+        """Start polling for permission grant.
+
+        One-shot timers rescheduled with a growing interval (0.5s up
+        to 3s) replace the old fixed 500ms repeating timer; each tick
+        crosses the PyObjC bridge and traps into
+        AXIsProcessTrustedWithOptions, so fewer ticks keep this
+        menu-bar helper's idle CPU down while the user is busy in
+        System Settings.
+        """
+        self._poll_interval = 0.5
+        self._schedule_check()
+
+    def _schedule_check(self):
+        """Arm a one-shot check at the current poll interval.
+
+        Block-based timers call straight back into Python - no
+        NSObject handler subclass, no selector dispatch per tick.
+        """
+        if self.check_timer:
+            self.check_timer.invalidate()
+        self.check_timer = NSTimer.scheduledTimerWithTimeInterval_repeats_block_(
+            self._poll_interval,
+            False,
+            lambda timer: self.check_permission()
         )
-    
+
+    def handle_resign_key(self):
+        """Pause polling while the window is in the background."""
+        if self.check_timer:
+            self.check_timer.invalidate()
+            self.check_timer = None
+
+    def handle_become_key(self):
+        """Resume polling promptly when the user comes back."""
+        if self.window and not self._granted and self.check_timer is None:
+            self._poll_interval = 0.5
+            self._schedule_check()
+
     def check_permission(self):
         """Check if permission was granted."""
+        self.check_timer = None
         if self.is_trusted():
             logger.info("Permission granted! Will restart app...")
+            self._granted = True
             self.update_status_label(True)
             self.continue_btn.setEnabled_(True)
             self.continue_btn.setTitle_("Restart Now")
             self.open_settings_btn.setTitle_("Settings ✓")
-            
-            # Stop checking
-            if self.check_timer:
-                self.check_timer.invalidate()
-                self.check_timer = None
-            
+
             # Auto-restart after 1.5 seconds
-            NSTimer.scheduledTimerWithTimeInterval_target_selector_userInfo_repeats_(
+            NSTimer.scheduledTimerWithTimeInterval_repeats_block_(
                 1.5,
-                self.timer_handler,
-                "autoRestart:",
-                None,
-                False
+                False,
+                lambda timer: self.do_restart()
             )
+        else:
+            # Back off; a grant is still noticed within a few seconds
+            self._poll_interval = min(self._poll_interval * 1.5, 3.0)
+            if self.window:
+                self._schedule_check()
     
     def do_complete(self, success: bool):
         """Complete the onboarding flow without restart."""
@@ -22,9 +22,27 @@ class ThemeManager(NSObject):
             return None
         
         self._is_dark = self._detect_dark_mode()
+        self._cache_colors()
         self._setup_observer()
-        
+
         return self
+
+    def _cache_colors(self):
+        """Resolve the NSColor instances once per appearance.
+
+        Property access then becomes a plain attribute load instead of
+        a PyObjC bridge call on every redraw.
+        """
+        self._bg = NSColor.windowBackgroundColor()
+        self._text = NSColor.labelColor()
+        self._secondary_text = NSColor.secondaryLabelColor()
+        self._accent = NSColor.controlAccentColor()
+        self._separator = NSColor.separatorColor()
+        self._control_bg = NSColor.controlBackgroundColor()
+        if self._is_dark:
+            self._drag_area = NSColor.colorWithCalibratedWhite_alpha_(0.15, 0.9)
+        else:
+            self._drag_area = NSColor.colorWithCalibratedWhite_alpha_(0.95, 0.9)
     
     def _detect_dark_mode(self) -> bool:
         """Detect if system is in dark mode."""
@@ -48,39 +66,38 @@ class ThemeManager(NSObject):
     def appearanceChanged_(self, notification):
         """Handle appearance change."""
         self._is_dark = self._detect_dark_mode()
-    
+        self._cache_colors()
+
     @property
     def is_dark_mode(self) -> bool:
         return self._is_dark
-    
-    # Dynamic colors that adapt automatically
+
+    # Dynamic colors, re-resolved on appearance change
     @property
     def background_color(self):
-        return NSColor.windowBackgroundColor()
-    
+        return self._bg
+
     @property
     def text_color(self):
-        return NSColor.labelColor()
-    
+        return self._text
+
     @property
     def secondary_text_color(self):
-        return NSColor.secondaryLabelColor()
-    
+        return self._secondary_text
+
     @property
     def accent_color(self):
-        return NSColor.controlAccentColor()
-    
+        return self._accent
+
     @property
     def separator_color(self):
-        return NSColor.separatorColor()
-    
+        return self._separator
+
     @property
     def control_background(self):
-        return NSColor.controlBackgroundColor()
-    
+        return self._control_bg
+
     # Drag area specific colors
     @property
     def drag_area_color(self):
-        if self._is_dark:
-            return NSColor.colorWithCalibratedWhite_alpha_(0.15, 0.9)
-        return NSColor.colorWithCalibratedWhite_alpha_(0.95, 0.9)
+        return self._drag_area
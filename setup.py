@@ -24,7 +24,9 @@ APP = ["OverAI.py"]
 
 # py2app options
 OPTIONS = {
-    "packages": ["overai"],
+    # psutil ships a C extension; copying it as a whole package lets
+    # py2app freeze it without scanning for submodules
+    "packages": ["overai", "psutil"],
     "includes": [
         "objc",
         "AppKit",
@@ -33,7 +35,6 @@ OPTIONS = {
         "Quartz",
         "AVFoundation",
         "ApplicationServices",
-        "psutil",
     ],
     "excludes": [
         "tkinter",
@@ -46,6 +47,8 @@ OPTIONS = {
         "torch",
     ],
     "argv_emulation": False,
+    # Nothing outside package_data should be auto-copied into Resources
+    "resources": [],
     "iconfile": "overai/logo/icon.icns",
     "plist": {
         "CFBundleName": "OverAI",
@@ -62,9 +65,13 @@ OPTIONS = {
         # App category
         "LSApplicationCategoryType": "public.app-category.productivity",
     },
-    # Optimization
-    "optimize": 1,
-    "compressed": True,
+    # Optimization: uncompressed site-packages lets the OS mmap the
+    # .pyc files directly at launch instead of decompressing each one
+    # on import; optimize=2 drops asserts and docstrings from the
+    # shipped bytecode
+    "optimize": 2,
+    "compressed": False,
+    "semi_standalone": False,
     "strip": True,
 }
 
@@ -83,6 +90,7 @@ setup(
             "logo/*.png",
             "logo/*.icns",
             "logo/icon.iconset/*.png",
+            "ui/resources/local_ai/*",
         ],
     },
     # install_requires removed (handled by environment for py2app)